@@ -18,34 +18,43 @@ This script uses custom classes as representations of Google Form questions unde
 # region Imports
 
 # External imports
-from collections import OrderedDict
+import asyncio
+import atexit
 from datetime import datetime, timezone
-from functools import wraps
+from functools import lru_cache
+from io import StringIO
+from itertools import accumulate
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import os
+from queue import SimpleQueue
 import random
 import re
+import secrets
 from telegram import (
+    Bot,
     CallbackQuery,
     InlineKeyboardButton,
     InlineKeyboardMarkup,
     MessageEntity,
-    ParseMode,
     ReplyKeyboardRemove,
     Update
 )
+from telegram.constants import ParseMode
 from telegram.error import BadRequest
 from telegram.ext import (
+    Application,
     CallbackContext,
     CallbackQueryHandler,
     CommandHandler,
     ConversationHandler,
-    Filters,
     Job,
     MessageHandler,
-    Updater
+    filters
 )
+from telegram.request import HTTPXRequest
 import traceback
-from typing import Any, Callable, Optional, Tuple, TypeVar, Union, cast
+from typing import Dict, List, Optional, Pattern, Tuple, Union
 
 # Local imports
 from config.config import get_telegram_token, get_developer_chat_id, get_port, is_dev, get_app_url
@@ -79,12 +88,16 @@ import utils
 # region Define constants
 
 # Set up logging
-logging.basicConfig(format='%(asctime)s - %(name)s - %(levelname)s - %(message)s', level=logging.INFO)
+# Records are queued by the caller and written to stderr by a listener thread, so bursts do not block the event loop
+_log_queue = SimpleQueue()
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+_log_listener = QueueListener(_log_queue, _log_stream_handler)
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(_log_queue)], force=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 _logger = logging.getLogger(__name__)
 
-# Type-hinting for decorator functions
-_F = TypeVar('_F', bound=Callable[..., Any])
-
 # region Telegram bot states
 
 (
@@ -123,8 +136,9 @@ _F = TypeVar('_F', bound=Callable[..., Any])
     _SELECTING_ACTION,  # Prompting user for action in main menu
     _STOPPING,  # Force stop in nested ConversationHandlers
     _CANCEL,  # Return to second-level menu in nested ConversationHandlers
-    _RETURN  # Return to main menu from nested ConversationHandlers
-) = utils.generate_random_signatures(27)
+    _RETURN,  # Return to main menu from nested ConversationHandlers
+    _CONTINUE  # Process the next Google Form question without waiting for user input
+) = utils.generate_random_signatures(28)
 
 # endregion Telegram bot states
 
@@ -137,6 +151,7 @@ _F = TypeVar('_F', bound=Callable[..., Any])
     _LOCAL_SAVE_PREF,  # For storing of question save preferences and/or answers
     _PREF_KEY,  # For storing of individual question save preference
     _ANSWER_KEY,  # For storing of individual question answer
+    _PREF_HEADER_INDEX,  # For indexing of question save preference keys by question header
 
     # For Google Form processing
     _PROCESSOR,  # For storing of FormProcessor object
@@ -147,14 +162,22 @@ _F = TypeVar('_F', bound=Callable[..., Any])
     _CURRENT_MARKUP,  # For storing of markup that is used to handle user input
     _CURRENT_PREF_KEY,  # For handling of local save preference
     _CURRENT_JOB,  # For processing of scheduled/scheduling jobs
+    _SUBMIT_LOCK,  # For serialising scheduled submissions of the same user
     _GARBAGE_INPUT_COUNTER  # For handling of unrecognised input
-) = utils.generate_random_signatures(12)
+) = utils.generate_random_signatures(14)
 
 # endregion User data constants
 
+# region Bot data constants
+
+_JOB_NAME_INDEX = utils.generate_random_signatures(1)  # For indexing the names of all scheduled jobs
+
+# endregion Bot data constants
+
 # region Garbage echoes
 
 _ANTI_GARBAGE_PROMPT_AFTER = 5
+_garbage_rng = random.Random()
 _standard_replies = ("mmhmm", "...", "I'm boreddd", "zzz", "sigh", "😪", "😴", "{}", "'{}', {} said.", "'{}'\n\t- {}")
 _rare_replies = (
     # Rare replies as easter eggs...?
@@ -167,7 +190,9 @@ _rare_replies = (
     "Hi, yes, you're currently talking to the developer."
     "Please leave your message after the tone:"
 )
-_garbage_replies = _standard_replies * 9 + _rare_replies
+# Each reply is paired with its number of format slots
+_garbage_replies = tuple((text, text.count("{}")) for text in _standard_replies + _rare_replies)
+_garbage_cum_weights = tuple(accumulate((9,) * len(_standard_replies) + (1,) * len(_rare_replies)))
 _anti_garbage_replies = (
     "💡 AutoGFormBot Notification 💡\n"
     "Sorry to disturb your fun, but I'm not a conversation bot 😰.\n"
@@ -187,39 +212,102 @@ _anti_garbage_replies = (
 # Telegram markup to return to main menu
 _RETURN_CALLBACK_DATA = "RETURN"
 
-# endregion Define constants
+# Label of the 'Other' option of option-based questions
+_OTHER_LABEL = BaseOptionQuestion.get_other_option_label()
 
-# region Helper functions
+# Answers denoting that a question is skipped, either via the 'Skip' option or the /skip command
+_SKIP_LABEL = BaseOptionMarkup.get_skip()
+_SLASH_SKIP = "/skip"
+_SKIP_TOKENS = frozenset((_SKIP_LABEL, _SLASH_SKIP))
 
-# endregion Helper functions
+# Sentinel for user data entries which are not found
+_MISSING = object()
 
-# region Creating reminders
+# Precompiled callback data patterns shared by the conversation handlers
+_TF_PATTERN = re.compile(TFMarkup.get_pattern())
+_FIXED_FREQ_PATTERN = re.compile("^(" + "|".join((FreqMarkup.get_hourly(), FreqMarkup.get_daily(),
+                                                  FreqMarkup.get_weekly(), FreqMarkup.get_monthly())) + ")$")
 
+# region Reminder menu texts
 
-@_handle_background
-def _remind_menu(update: Update, _: CallbackContext) -> str:
-    """Handles the reminder menu.
+_REMIND_MENU_TEXT = utils.text_to_markdownv2(
+    "⏰ SCHEDULER MENU ⏰\n\n"
+    "➕ Schedule a new submission job.\n"
+    "🗑️ Remove a current submission job.\n"
+    "🔙 Return to the main menu.\n\n"
+    "Please select an option:"
+)
+_SELECT_FREQ_TEXT = utils.text_to_markdownv2("How often should this job be run?")
+_SELECT_START_TEXT = utils.text_to_markdownv2("Please select your start date and time.\n"
+                                              "NOTE: Convert your time into UTC and select that time below.")
+_CUSTOM_FREQ_TEXT = utils.text_to_markdownv2("Please select your frequency.\n"
+                                             "(minimum frequency is 5 minutes)")
+_NO_REMINDERS_TEXT = utils.text_to_markdownv2("⚠️ NO REMINDERS DETECTED ⚠️\n"
+                                              "There are no more reminders to remove!")
+_SELECT_JOB_TEXT = utils.text_to_markdownv2("🔍 Please select a job:")
+_CONFIRM_REMOVE_TEXT = utils.text_to_markdownv2("⚠️ IRREVERSIBLE ACTION WARNING ⚠️\n"
+                                                "Are you sure you want to remove this job?")
+_JOB_SCHEDULED_TEXT = utils.text_to_markdownv2("🥳 Job successfully scheduled! 🥳")
+_JOB_ABORTED_TEXT = utils.text_to_markdownv2("Scheduling of job aborted!")
+_JOB_REMOVED_TEXT = utils.text_to_markdownv2("Job successfully removed!")
+_REMOVAL_ABORTED_TEXT = utils.text_to_markdownv2("Removal successfully aborted!")
+_JOB_ERROR_TEXT = utils.text_to_markdownv2("🚨 JOB ENCOUNTERED ERROR 🚨\n"
+                                           "Please try again later.")
+
+# endregion Reminder menu texts
+
+# region Question prompt texts
+
+_PROMPT_DIVIDER = "\n==============\n"
+_PROMPT_NO_HEADER = "(no header)"
+_PROMPT_NO_DESCRIPTION = "(no description)"
+_PROMPT_REQUIRED = "\n\nThis is a required question."
+_PROMPT_SUB_QUESTION = "\n\nProcessing answer for {}."
+_PROMPT_SAVED_ANSWER = "\n\n💡 SAVED ANSWER DETECTED 💡\n" \
+                       "I've previously saved the following answer:\n" \
+                       "{}\n" \
+                       "Would you like to submit this answer?"
+_PROMPT_RECOMMENDATION = "\n\n💡 ANSWER RECOMMENDATION 💡\n" \
+                         "Based on the question, I recommend:\n" \
+                         "{}\n" \
+                         "Would you like to accept my recommendation?"
+_PROMPT_SELECT = "\n\nPlease select your answer."
+_PROMPT_INPUT = "\n\nPlease input your answer."
+_PROMPT_SKIP_OPTION = "\nTo skip the question, select the 'Skip' option or type '/skip'."
+_PROMPT_SKIP_INPUT = "\nTo skip the question, type '/skip'."
+
+# endregion Question prompt texts
+
+# region Form processing texts
+
+_LOADING_TEXT = utils.text_to_markdownv2("Please wait...")
+_REQUIRED_SKIP_TEXT = utils.text_to_markdownv2("Sorry, I can't allow you to skip this question "
+                                               "because it is required 😢")
+_SPECIFY_OTHER_TEXT = utils.text_to_markdownv2("Please specify your alternative option:")
+_CONFIRM_SKIP_TEXT = utils.text_to_markdownv2("Are you sure you want to skip this question?")
+_FORM_SUBMITTED_TEXT = utils.text_to_markdownv2("🥳 The form has submitted successfully! 🥳")
+_RETURN_TO_MAIN_MENU_TEXT = utils.text_to_markdownv2("Return to main menu")
+_ANSWER_SAVED_TEXT = utils.text_to_markdownv2("Your answer has been automatically saved!")
+_ANSWER_DISCARDED_TEXT = utils.text_to_markdownv2("Your answer has been automatically discarded!")
+_SAVE_ANSWER_PROMPT_TEXT = utils.text_to_markdownv2("💡 SAVE ANSWER PROMPT 💡\n"
+                                                    "Would you like me to save your answer to this question "
+                                                    "for future submissions?")
+
+# endregion Form processing texts
 
-    :param update: The update instance to handle the reminder menu.
-    :return: The _SELECTING_ACTION state for handling of menu options.
-    """
+# endregion Define constants
 
-    # region Initialisation
+# region Helper functions
 
-    try:
-        assert update.callback_query
-    except AssertionError as error:
-        _logger.error("_remind_menu AssertionError detected while trying to initialise:\n%s", error)
-        if update.message:
-            utils.send_bug_message(update.message)
-        return _STOPPING
-    update.callback_query.answer()
 
-    # endregion Initialisation
+@lru_cache(maxsize=None)
+def _remind_menu_markup() -> InlineKeyboardMarkup:
+    """Builds the reminder menu keyboard once and reuses it for every render.
 
-    # region Initialise remind menu
+    :return: The reminder menu keyboard.
+    """
 
-    reply_markup = BaseMarkup().get_markup(
+    return BaseMarkup().get_markup(
         "➕ Schedule new submission job ➕",
         "🗑️ Remove current submission job 🗑️",
         "🔙 Return to main menu 🔙",
@@ -229,21 +317,88 @@ def _remind_menu(update: Update, _: CallbackContext) -> str:
             "🔙 Return to main menu 🔙": _RETURN_CALLBACK_DATA
         }
     )
-    text = utils.text_to_markdownv2(
-        "⏰ SCHEDULER MENU ⏰\n\n"
-        "➕ Schedule a new submission job.\n"
-        "🗑️ Remove a current submission job.\n"
-        "🔙 Return to the main menu.\n\n"
-        "Please select an option:"
-    )
 
-    # endregion Initialise remind menu
 
-    update.callback_query.edit_message_text(text, parse_mode=ParseMode.MARKDOWN_V2, reply_markup=reply_markup)
+@lru_cache(maxsize=None)
+def _freq_markup() -> InlineKeyboardMarkup:
+    """Builds the reminder frequency keyboard once and reuses it for every render.
+
+    :return: The reminder frequency keyboard.
+    """
+
+    return FreqMarkup.get_markup()
+
+
+@lru_cache(maxsize=None)
+def _tf_markup() -> InlineKeyboardMarkup:
+    """Builds the confirmation keyboard once and reuses it for every render.
+
+    :return: The confirmation keyboard.
+    """
+
+    return TFMarkup.get_markup()
+
+
+@lru_cache(maxsize=None)
+def _ok_markup() -> InlineKeyboardMarkup:
+    """Builds the single-button keyboard returning to the reminder menu once and reuses it for every render.
+
+    :return: The keyboard returning to the reminder menu.
+    """
+
+    return InlineKeyboardMarkup([[InlineKeyboardButton("OK", callback_data=_SET_REMINDER)]])
+
+
+async def _answer_and_edit(callback_query: CallbackQuery, text: str,
+                           reply_markup: Optional[InlineKeyboardMarkup] = None) -> None:
+    """Answers the callback query and edits its message concurrently.
+
+    :param callback_query: The CallbackQuery instance to answer and edit the message of.
+    :param text: The MarkdownV2 text to edit the message with.
+    :param reply_markup: The keyboard to attach to the edited message.
+    """
+
+    await asyncio.gather(callback_query.answer(),
+                         callback_query.edit_message_text(text, parse_mode=ParseMode.MARKDOWN_V2,
+                                                          reply_markup=reply_markup))
+
+
+@lru_cache(maxsize=32)
+def _compile_pattern(pattern: str) -> Pattern:
+    """Compiles the callback data pattern of a markup once and reuses it for every question with the same options.
+
+    :param pattern: The regex pattern to compile.
+    :return: The compiled pattern.
+    """
+
+    return re.compile(pattern)
+
+# endregion Helper functions
+
+# region Creating reminders
+
+
+async def _remind_menu(update: Update, _: CallbackContext) -> str:
+    """Handles the reminder menu.
+
+    :param update: The update instance to handle the reminder menu.
+    :return: The _SELECTING_ACTION state for handling of menu options.
+    """
+
+    # region Initialisation
+
+    if not update.callback_query:
+        _logger.error("_remind_menu sanity check failed while trying to initialise")
+        await utils.send_bug_message_auto(update)
+        return _STOPPING
+
+    # endregion Initialisation
+
+    await _answer_and_edit(update.callback_query, _REMIND_MENU_TEXT, _remind_menu_markup())
     return _SELECTING_ACTION
 
 
-def _remind_return(update: Update, context: CallbackContext) -> str:
+async def _remind_return(update: Update, context: CallbackContext) -> str:
     """Handles returning from reminder menu to main menu.
 
     :param update: The update instance to return to the main menu.
@@ -251,11 +406,11 @@ def _remind_return(update: Update, context: CallbackContext) -> str:
     :return: The _RETURN state to return to the main menu.
     """
 
-    _ = _main_menu(update, context)
+    _ = await _main_menu(update, context)
     return _RETURN
 
 
-def _auto_submit(context: CallbackContext) -> None:
+async def _auto_submit(context: CallbackContext) -> None:
     """Function to be called by each scheduled job to auto-submit Google Form.
 
     :param context: The CallbackContext instance to submit the Google Form.
@@ -264,52 +419,57 @@ def _auto_submit(context: CallbackContext) -> None:
     # region Initialisation
 
     global answer_handler
-    update = None
-    try:
-        update, job_context = context.job.context
-        assert isinstance(update, Update)
-        assert update.callback_query
-        assert isinstance(job_context, CallbackContext)
-        assert isinstance(job_context.user_data, dict)
-    except AssertionError as error:
-        _logger.error("_auto_submit AssertionError detected while trying to initialise:\n%s", error)
-        if isinstance(update, Update):
-            if update.message:
-                utils.send_bug_message(update.message)
-            elif update.callback_query:
-                utils.send_bug_message(update.callback_query.message)
-        return _STOPPING
+    update = context.job.data
+    if not (isinstance(update, Update) and update.callback_query) or not isinstance(context.user_data, dict):
+        _logger.error("_auto_submit sanity check failed while trying to initialise")
+        await utils.send_bug_message_auto(update)
+        return
 
     # endregion Initialisation
 
     # Check if another submission is currently being processed
-    if isinstance(job_context.user_data.get(_PROCESSOR), FormProcessor):
+    lock = context.user_data.get(_SUBMIT_LOCK)
+    if lock is None:
+        lock = context.user_data[_SUBMIT_LOCK] = asyncio.Lock()
+    if lock.locked() or isinstance(context.user_data.get(_PROCESSOR), FormProcessor):
         _logger.info("_auto_submit Scheduled job has been cancelled due to active submission attempt.")
         return
 
-    # Attemot to auto-submit
-    state = _obtain_question(update, job_context)
-    if state == _STOPPING:
-        _remove_current_pointers(job_context)
-        processor = job_context.user_data.get(_PROCESSOR)
-        if isinstance(processor, FormProcessor):
-            processor.get_browser().close_browser()
-            job_context.user_data[_PROCESSOR] = processor.get_browser().get_link()
-        answer_handler.pattern = re.compile("^$")
-        try:
-            update.callback_query.edit_message_text(utils.text_to_markdownv2("🚨 JOB ENCOUNTERED ERROR 🚨\n"
-                                                                             "Please try again later."),
-                                                    parse_mode=ParseMode.MARKDOWN_V2,
-                                                    reply_markup=InlineKeyboardMarkup([[
-                                                        InlineKeyboardButton("OK", callback_data=_SET_REMINDER)]]))
-        except BadRequest:
-            _logger.info("_auto_submit Error message already displayed.")
+    # Attempt to auto-submit
+    async with lock:
+        state = await _obtain_question(update, context)
+        if state == _STOPPING:
+            _remove_current_pointers(context)
+            processor = context.user_data.get(_PROCESSOR)
+            if isinstance(processor, FormProcessor):
+                await asyncio.to_thread(processor.get_browser().close_browser)
+                context.user_data[_PROCESSOR] = processor.get_browser().get_link()
+            answer_handler.set_pattern(update.effective_user.id, None)
+            try:
+                await update.callback_query.edit_message_text(_JOB_ERROR_TEXT, parse_mode=ParseMode.MARKDOWN_V2,
+                                                              reply_markup=_ok_markup())
+            except BadRequest:
+                _logger.info("_auto_submit Error message already displayed.")
 
 # region Adding job
 
+# Scheduling function for each fixed reminder frequency
+_FREQ_DISPATCH = {
+    FreqMarkup.get_hourly(): lambda job_queue, start, **kwargs: job_queue.run_repeating(
+        _auto_submit, 60 * 60, first=start, **kwargs),
+    FreqMarkup.get_daily(): lambda job_queue, start, **kwargs: job_queue.run_daily(
+        _auto_submit, start.time(), **kwargs),
+    FreqMarkup.get_weekly(): lambda job_queue, start, **kwargs: job_queue.run_repeating(
+        _auto_submit, 60 * 60 * 24 * 7, first=start, **kwargs),
+    FreqMarkup.get_monthly(): lambda job_queue, start, **kwargs: job_queue.run_monthly(
+        _auto_submit, start.time(), start.day, **kwargs)
+}
 
-@_handle_background
-def _select_frequency(update: Update, _: CallbackContext) -> str:
+# Days, hours and minutes of a custom reminder frequency
+_CUSTOM_FREQ_RE = re.compile(r"\D*(\d+)\D+(\d+)\D+(\d+)\D*")
+
+
+async def _select_frequency(update: Update, _: CallbackContext) -> str:
     """Handles selection of reminder frequency.
 
     :param update: The update instance to handle selection of reminder frequency.
@@ -318,25 +478,18 @@ def _select_frequency(update: Update, _: CallbackContext) -> str:
 
     # region Initialisation
 
-    try:
-        assert update.callback_query
-    except AssertionError as error:
-        _logger.error("_select_frequency AssertionError detected while trying to initialise:\n%s", error)
-        if update.message:
-            utils.send_bug_message(update.message)
+    if not update.callback_query:
+        _logger.error("_select_frequency sanity check failed while trying to initialise")
+        await utils.send_bug_message_auto(update)
         return _STOPPING
-    update.callback_query.answer()
 
     # endregion Initialisation
 
-    update.callback_query.edit_message_text(utils.text_to_markdownv2("How often should this job be run?"),
-                                            parse_mode=ParseMode.MARKDOWN_V2,
-                                            reply_markup=FreqMarkup.get_markup())
+    await _answer_and_edit(update.callback_query, _SELECT_FREQ_TEXT, _freq_markup())
     return _CHOOSE_FREQ
 
 
-@_handle_background
-def _fixed_frequency(update: Update, context: CallbackContext) -> str:
+async def _fixed_frequency(update: Update, context: CallbackContext) -> str:
     """Displays menu to select start date.
 
     :param update: The update instance to display menu to select start date.
@@ -346,34 +499,21 @@ def _fixed_frequency(update: Update, context: CallbackContext) -> str:
 
     # region Initialisation
 
-    try:
-        assert update.callback_query
-        assert _CURRENT_MARKUP not in context.user_data.keys()
-        assert _CURRENT_JOB not in context.user_data.keys()
-    except AssertionError as error:
-        _logger.error("_fixed_frequency AssertionError detected while trying to initialise:\n%s", error)
-        if update.message:
-            utils.send_bug_message(update.message)
-        elif update.callback_query:
-            utils.send_bug_message(update.callback_query.message)
+    if not update.callback_query or _CURRENT_MARKUP in context.user_data or _CURRENT_JOB in context.user_data:
+        _logger.error("_fixed_frequency sanity check failed while trying to initialise")
+        await utils.send_bug_message_auto(update)
         return _STOPPING
     context.user_data[_CURRENT_JOB] = update.callback_query.data
-    update.callback_query.answer()
 
     # endregion Initialisation
 
     markup = DatetimeMarkup(True, from_date=datetime.now())
     context.user_data[_CURRENT_MARKUP] = markup
-    update.callback_query.edit_message_text(utils.text_to_markdownv2(
-        "Please select your start date and time.\n"
-        "NOTE: Convert your time into UTC and select that time below."),
-                                            parse_mode=ParseMode.MARKDOWN_V2,
-                                            reply_markup=markup.get_markup())
+    await _answer_and_edit(update.callback_query, _SELECT_START_TEXT, markup.get_markup())
     return _SELECT_START
 
 
-@_handle_background
-def _custom_frequency(update: Update, context: CallbackContext) -> str:
+async def _custom_frequency(update: Update, context: CallbackContext) -> str:
     """Displays menu to customise reminder frequency.
 
     :param update: The update instance to display menu to customise reminder frequency.
@@ -383,31 +523,20 @@ def _custom_frequency(update: Update, context: CallbackContext) -> str:
 
     # region Initialisation
 
-    try:
-        assert update.callback_query
-        assert _CURRENT_MARKUP not in context.user_data.keys()
-    except AssertionError as error:
-        _logger.error("_custom_frequency AssertionError detected while trying to initialise:\n%s", error)
-        if update.message:
-            utils.send_bug_message(update.message)
-        elif update.callback_query:
-            utils.send_bug_message(update.callback_query.message)
+    if not update.callback_query or _CURRENT_MARKUP in context.user_data:
+        _logger.error("_custom_frequency sanity check failed while trying to initialise")
+        await utils.send_bug_message_auto(update)
         return _STOPPING
-    update.callback_query.answer()
 
     # endregion Initialisation
 
     markup = FreqCustomMarkup()
     context.user_data[_CURRENT_MARKUP] = markup
-    update.callback_query.edit_message_text(utils.text_to_markdownv2("Please select your frequency.\n"
-                                                                     "(minimum frequency is 5 minutes)"),
-                                            parse_mode=ParseMode.MARKDOWN_V2,
-                                            reply_markup=markup.get_markup())
+    await _answer_and_edit(update.callback_query, _CUSTOM_FREQ_TEXT, markup.get_markup())
     return _CUSTOM_FREQ
 
 
-@_handle_background
-def _handle_custom(update: Update, context: CallbackContext) -> str:
+async def _handle_custom(update: Update, context: CallbackContext) -> str:
     """Handles reminder frequency customisation.
 
     :param update: The update instance to handle reminder frequency customisation.
@@ -417,45 +546,37 @@ def _handle_custom(update: Update, context: CallbackContext) -> str:
 
     # region Initialisation
 
-    try:
-        assert update.callback_query.data
-        assert isinstance(context.user_data.get(_CURRENT_MARKUP), FreqCustomMarkup)
-        assert _CURRENT_JOB not in context.user_data.keys()
-    except AssertionError as error:
-        _logger.error("_handle_custom AssertionError detected while trying to initialise:\n%s", error)
-        if update.message:
-            utils.send_bug_message(update.message)
-        elif update.callback_query:
-            utils.send_bug_message(update.callback_query.message)
+    if not (update.callback_query and update.callback_query.data) or \
+            not isinstance(context.user_data.get(_CURRENT_MARKUP), FreqCustomMarkup) or \
+            _CURRENT_JOB in context.user_data:
+        _logger.error("_handle_custom sanity check failed while trying to initialise")
+        await utils.send_bug_message_auto(update)
         return _STOPPING
     result = context.user_data.get(_CURRENT_MARKUP).perform_action(update.callback_query.data)
     if result == FreqCustomMarkup.get_invalid_message():
-        update.callback_query.answer(result)
+        await update.callback_query.answer(result)
         return _CUSTOM_FREQ
-    update.callback_query.answer()
+    await update.callback_query.answer()
 
     # endregion Initialisation
 
     # Handle result from FreqCustomMarkup
     if isinstance(result, InlineKeyboardMarkup):
-        update.callback_query.edit_message_text(utils.text_to_markdownv2(update.callback_query.message.text),
-                                                parse_mode=ParseMode.MARKDOWN_V2,
-                                                reply_markup=result)
+        await update.callback_query.edit_message_text(utils.text_to_markdownv2(update.callback_query.message.text),
+                                                      parse_mode=ParseMode.MARKDOWN_V2,
+                                                      reply_markup=result)
     elif isinstance(result, str):
         context.user_data[_CURRENT_JOB] = "Submit every " + result
         markup = DatetimeMarkup(True, from_date=datetime.utcnow().replace(tzinfo=timezone.utc))
         context.user_data[_CURRENT_MARKUP] = markup
-        update.callback_query.edit_message_text(utils.text_to_markdownv2(
-            "Please select your start date and time.\n"
-            "NOTE: Convert your time into UTC and select that time below."),
-                                                parse_mode=ParseMode.MARKDOWN_V2,
-                                                reply_markup=markup.get_markup())
+        await update.callback_query.edit_message_text(_SELECT_START_TEXT,
+                                                      parse_mode=ParseMode.MARKDOWN_V2,
+                                                      reply_markup=markup.get_markup())
         return _SELECT_START
     return _CUSTOM_FREQ
 
 
-@_handle_background
-def _start_date(update: Update, context: CallbackContext) -> str:
+async def _start_date(update: Update, context: CallbackContext) -> str:
     """Handles the selection of job start date.
 
     :param update: The update instance to handle the selection of job start date.
@@ -465,16 +586,11 @@ def _start_date(update: Update, context: CallbackContext) -> str:
 
     # region Initialisation
 
-    try:
-        assert update.callback_query.data
-        assert isinstance(context.user_data.get(_CURRENT_MARKUP), DatetimeMarkup)
-        assert isinstance(context.user_data.get(_CURRENT_JOB), str)
-    except AssertionError as error:
-        _logger.error("_start_date AssertionError detected while trying to initialise:\n%s", error)
-        if update.message:
-            utils.send_bug_message(update.message)
-        elif update.callback_query:
-            utils.send_bug_message(update.callback_query.message)
+    if not (update.callback_query and update.callback_query.data) or \
+            not isinstance(context.user_data.get(_CURRENT_MARKUP), DatetimeMarkup) or \
+            not isinstance(context.user_data.get(_CURRENT_JOB), str):
+        _logger.error("_start_date sanity check failed while trying to initialise")
+        await utils.send_bug_message_auto(update)
         return _STOPPING
 
     # endregion Initialisation
@@ -482,33 +598,30 @@ def _start_date(update: Update, context: CallbackContext) -> str:
     # Obtain result
     result = context.user_data.get(_CURRENT_MARKUP).perform_action(update.callback_query.data)
     if result == DatetimeMarkup.get_required_warning():
-        update.callback_query.answer(result)
+        await update.callback_query.answer(result)
         return _SELECT_START
 
     # Handle result from DatetimeMarkup
     if isinstance(result, InlineKeyboardMarkup):
-        update.callback_query.edit_message_text(utils.text_to_markdownv2(update.callback_query.message.text),
-                                                parse_mode=ParseMode.MARKDOWN_V2,
-                                                reply_markup=result)
+        await update.callback_query.edit_message_text(utils.text_to_markdownv2(update.callback_query.message.text),
+                                                      parse_mode=ParseMode.MARKDOWN_V2,
+                                                      reply_markup=result)
     elif isinstance(result, str):
         job_name = "{}, starting from {}".format(context.user_data.get(_CURRENT_JOB), result)
-        if context.job_queue.get_jobs_by_name(job_name):
-            update.callback_query.answer("ALERT: An identical job already exists!")
+        if job_name in context.bot_data.get(_JOB_NAME_INDEX, ()):
+            await update.callback_query.answer("ALERT: An identical job already exists!")
             return _SELECT_START
-        update.callback_query.answer()
         _ = context.user_data.pop(_CURRENT_MARKUP)
         context.user_data[_CURRENT_JOB] = job_name
-        update.callback_query.edit_message_text(utils.text_to_markdownv2("Please confirm to schedule this job:\n"
-                                                                         "{}".format(job_name)),
-                                                parse_mode=ParseMode.MARKDOWN_V2,
-                                                reply_markup=TFMarkup.get_markup())
+        await _answer_and_edit(update.callback_query,
+                               utils.text_to_markdownv2("Please confirm to schedule this job:\n{}".format(job_name)),
+                               _tf_markup())
         return _CONFIRM_ADD
-    update.callback_query.answer()
+    await update.callback_query.answer()
     return _SELECT_START
 
 
-@_handle_background
-def _confirm_add(update: Update, context: CallbackContext) -> str:
+async def _confirm_add(update: Update, context: CallbackContext) -> str:
     """Handles confirmation of job to schedule.
 
     :param update: The update instance to confirm scheduled job.
@@ -518,27 +631,18 @@ def _confirm_add(update: Update, context: CallbackContext) -> str:
 
     # region Initialisation
 
+    job_name = context.user_data.get(_CURRENT_JOB)
+    if not (update.callback_query and update.callback_query.data) or not isinstance(job_name, str):
+        _logger.error("_confirm_add sanity check failed while trying to initialise")
+        await utils.send_bug_message_auto(update)
+        return _STOPPING
     try:
-        assert update.callback_query.data
-        job_name = context.user_data.get(_CURRENT_JOB)
-        assert isinstance(job_name, str)
         freq, start = job_name.split(", starting from ")
-    except AssertionError as error:
-        _logger.error("_confirm_add AssertionError detected while trying to initialise:\n%s", error)
-        if update.message:
-            utils.send_bug_message(update.message)
-        elif update.callback_query:
-            utils.send_bug_message(update.callback_query.message)
-        return _STOPPING
     except ValueError:
-        _logger.error("_confirm_add Current job not recognised: %s", context.user_data.get(_CURRENT_JOB))
-        if update.message:
-            utils.send_bug_message(update.message)
-        elif update.callback_query:
-            utils.send_bug_message(update.callback_query.message)
+        _logger.error("_confirm_add Current job not recognised: %s", job_name)
+        await utils.send_bug_message_auto(update)
         return _STOPPING
     result = update.callback_query.data
-    update.callback_query.answer()
 
     # endregion Initialisation
 
@@ -547,53 +651,51 @@ def _confirm_add(update: Update, context: CallbackContext) -> str:
     # Ensure callback data is valid
     if TFMarkup.confirm(result) is None:
         _logger.error("_confirm_add Invalid callback data received: %s", result)
-        utils.send_bug_message(update.callback_query.message)
+        await utils.send_bug_message_auto(update)
         return _STOPPING
 
     # Ensure start date is valid
     try:
-        start_datetime = datetime.strptime(start, "%Y-%m-%d %H:%M").replace(tzinfo=timezone.utc)
+        if len(start) != 16 or start[4] != "-" or start[7] != "-" or start[10] != " " or start[13] != ":":
+            raise ValueError
+        start_datetime = datetime(int(start[0:4]), int(start[5:7]), int(start[8:10]), int(start[11:13]),
+                                  int(start[14:16]), tzinfo=timezone.utc)
     except ValueError:
         _logger.error("_confirm_add Start date not recognised: %s", start)
-        utils.send_bug_message(update.callback_query.message)
+        await utils.send_bug_message_auto(update)
         return _STOPPING
 
     # endregion Sanity check
 
     # Handle confirmation
+    # Only the originating update is kept by the job; user data is looked up through chat_id and user_id on each run
     result = TFMarkup.confirm(result)
     if result:
-        if freq == FreqMarkup.get_hourly():
-            _ = context.job_queue.run_repeating(_auto_submit, 60 * 60, first=start_datetime, name=job_name,
-                                                context=(update, context))
-        elif freq == FreqMarkup.get_daily():
-            _ = context.job_queue.run_daily(_auto_submit, start_datetime.time(), name=job_name,
-                                            context=(update, context))
-        elif freq == FreqMarkup.get_weekly():
-            _ = context.job_queue.run_repeating(_auto_submit, 60 * 60 * 24 * 7, first=start_datetime, name=job_name,
-                                                context=(update, context))
-        elif freq == FreqMarkup.get_monthly():
-            _ = context.job_queue.run_monthly(_auto_submit, start_datetime.time(), start_datetime.day, name=job_name,
-                                              context=(update, context), day_is_strict=False)
+        chat_id, user_id = update.effective_chat.id, update.effective_user.id
+        schedule = _FREQ_DISPATCH.get(freq)
+        if schedule:
+            _ = schedule(context.job_queue, start_datetime, name=job_name, data=update,
+                         chat_id=chat_id, user_id=user_id)
         else:
             try:
-                days, hours, minutes = re.findall(r"[0-9]+", freq)
-                if not FreqCustomMarkup.valid_freq(int(days), int(hours), int(minutes)):
+                match = _CUSTOM_FREQ_RE.fullmatch(freq)
+                if not match:
+                    raise ValueError
+                days, hours, minutes = map(int, match.groups())
+                if not FreqCustomMarkup.valid_freq(days, hours, minutes):
                     raise ValueError
             except ValueError:
                 _logger.error("_confirm_add Frequency not recognised: %s", freq)
-                utils.send_bug_message(update.callback_query.message)
+                await utils.send_bug_message_auto(update)
                 return _STOPPING
-            _ = context.job_queue.run_repeating(_auto_submit, 60 * ((int(days) * 24 + int(hours)) * 60 + int(minutes)),
-                                                first=start_datetime, name=job_name, context=(update, context))
+            _ = context.job_queue.run_repeating(_auto_submit, 60 * ((days * 24 + hours) * 60 + minutes),
+                                                first=start_datetime, name=job_name, data=update,
+                                                chat_id=chat_id, user_id=user_id)
+        context.bot_data.setdefault(_JOB_NAME_INDEX, set()).add(job_name)
 
     # Final preparations
     _ = context.user_data.pop(_CURRENT_JOB)
-    update.callback_query.edit_message_text(utils.text_to_markdownv2("🥳 Job successfully scheduled! 🥳" if result else
-                                                                     "Scheduling of job aborted!"),
-                                            parse_mode=ParseMode.MARKDOWN_V2,
-                                            reply_markup=InlineKeyboardMarkup([[
-                                                InlineKeyboardButton("OK", callback_data=_SET_REMINDER)]]))
+    await _answer_and_edit(update.callback_query, _JOB_SCHEDULED_TEXT if result else _JOB_ABORTED_TEXT, _ok_markup())
     return _CANCEL
 
 # endregion Adding job
@@ -601,8 +703,7 @@ def _confirm_add(update: Update, context: CallbackContext) -> str:
 # region Removing job
 
 
-@_handle_background
-def _confirm_removal(update: Update, context: CallbackContext) -> str:
+async def _confirm_removal(update: Update, context: CallbackContext) -> str:
     """Handles confirmation of removal of reminder.
 
     :param update: The update instance to handle confirmation of removal of reminder.
@@ -612,18 +713,11 @@ def _confirm_removal(update: Update, context: CallbackContext) -> str:
 
     # region Initialisation
 
-    try:
-        assert update.callback_query.data
-        assert _CURRENT_JOB not in context.user_data.keys()
-    except AssertionError as error:
-        _logger.error("_confirm_removal AssertionError detected while trying to initialise:\n%s", error)
-        if update.message:
-            utils.send_bug_message(update.message)
-        elif update.callback_query:
-            utils.send_bug_message(update.callback_query.message)
+    if not (update.callback_query and update.callback_query.data) or _CURRENT_JOB in context.user_data:
+        _logger.error("_confirm_removal sanity check failed while trying to initialise")
+        await utils.send_bug_message_auto(update)
         return _STOPPING
     result = update.callback_query.data
-    update.callback_query.answer()
 
     # endregion Initialisation
 
@@ -631,26 +725,46 @@ def _confirm_removal(update: Update, context: CallbackContext) -> str:
     jobs = context.job_queue.get_jobs_by_name(result)
     if len(jobs) == 0:
         _logger.error("_confirm_removal No jobs found with name: %s", result)
-        utils.send_bug_message(update.callback_query.message)
+        await utils.send_bug_message_auto(update)
         return _STOPPING
     elif len(jobs) > 1:
         _logger.warning("_confirm removal Multiple jobs found with name %s, selecting first one. Please debug", result)
 
     # Display confirmation
     context.user_data[_CURRENT_JOB] = jobs[0]
-    update.callback_query.edit_message_text(utils.text_to_markdownv2("⚠️ IRREVERSIBLE ACTION WARNING ⚠️\n"
-                                                                     "Are you sure you want to remove this job?"),
-                                            parse_mode=ParseMode.MARKDOWN_V2,
-                                            reply_markup=TFMarkup.get_markup())
+    await _answer_and_edit(update.callback_query, _CONFIRM_REMOVE_TEXT, _tf_markup())
     return _CONFIRM_REMOVE
 
 
+class _JobNameHandler(CallbackQueryHandler):
+    """CallbackQueryHandler which only accepts callback data matching the name of a scheduled job.
+
+    The job names are stored as a frozenset and matched by membership,
+    which avoids compiling a regex alternation of every job name whenever the removal menu is opened.
+    """
+
+    __slots__ = ("job_names",)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.job_names = frozenset()
+
+    def check_update(self, update: object) -> bool:
+        """Determines whether the update should be handled.
+
+        :param update: The update instance to check.
+        :return: True if the callback data is the name of a scheduled job, False otherwise.
+        """
+
+        return isinstance(update, Update) and update.callback_query is not None and \
+            update.callback_query.data in self.job_names
+
+
 # Dynamic callback handler
-remind_handler = CallbackQueryHandler(_confirm_removal)
+remind_handler = _JobNameHandler(_confirm_removal)
 
 
-@_handle_background
-def _select_reminder(update: Update, context: CallbackContext) -> str:
+async def _select_reminder(update: Update, context: CallbackContext) -> str:
     """Handles selection of scheduled reminder to remove.
 
     :param update: The update instance to handle selection of reminder.
@@ -660,39 +774,27 @@ def _select_reminder(update: Update, context: CallbackContext) -> str:
 
     # region Initialisation
 
-    try:
-        assert update.callback_query
-    except AssertionError as error:
-        _logger.error("_select_reminder AssertionError detected while trying to initialise:\n%s", error)
-        if update.message:
-            utils.send_bug_message(update.message)
+    if not update.callback_query:
+        _logger.error("_select_reminder sanity check failed while trying to initialise")
+        await utils.send_bug_message_auto(update)
         return _STOPPING
-    update.callback_query.answer()
 
     # endregion Initialisation
 
     # Check if there are scheduled reminders
     jobs = context.job_queue.jobs()
     if len(jobs) == 0:
-        update.callback_query.edit_message_text(
-            utils.text_to_markdownv2("⚠️ NO REMINDERS DETECTED ⚠️\n"
-                                     "There are no more reminders to remove!"),
-            parse_mode=ParseMode.MARKDOWN_V2,
-            reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("OK", callback_data=_SET_REMINDER)]])
-        )
+        await _answer_and_edit(update.callback_query, _NO_REMINDERS_TEXT, _ok_markup())
         return _CANCEL
 
     # Format and output all jobs
-    remind_handler.pattern = re.compile("^(" + "|".join([job.name for job in jobs]) + ")$")
+    remind_handler.job_names = frozenset(job.name for job in jobs)
     markup = [[InlineKeyboardButton(job.name, callback_data=job.name) for job in jobs]]  # Maximum length of name is 59
-    update.callback_query.edit_message_text(utils.text_to_markdownv2("🔍 Please select a job:"),
-                                            parse_mode=ParseMode.MARKDOWN_V2,
-                                            reply_markup=InlineKeyboardMarkup(markup))
+    await _answer_and_edit(update.callback_query, _SELECT_JOB_TEXT, InlineKeyboardMarkup(markup))
     return _SELECT_JOB
 
 
-@_handle_background
-def _perform_removal(update: Update, context: CallbackContext) -> str:
+async def _perform_removal(update: Update, context: CallbackContext) -> str:
     """Handles removal of reminder based on user input.
 
     :param update: The update instance to handle reminder removal.
@@ -702,39 +804,31 @@ def _perform_removal(update: Update, context: CallbackContext) -> str:
 
     # region Initialisation
 
-    try:
-        assert update.callback_query.data
-        assert isinstance(context.user_data.get(_CURRENT_JOB), Job)
-    except AssertionError as error:
-        _logger.error("_perform_removal AssertionError detected while trying to initialise:\n%s", error)
-        if update.message:
-            utils.send_bug_message(update.message)
-        elif update.callback_query:
-            utils.send_bug_message(update.callback_query.message)
+    if not (update.callback_query and update.callback_query.data) or \
+            not isinstance(context.user_data.get(_CURRENT_JOB), Job):
+        _logger.error("_perform_removal sanity check failed while trying to initialise")
+        await utils.send_bug_message_auto(update)
         return _STOPPING
     result = update.callback_query.data
-    update.callback_query.answer()
 
     # endregion Initialisation
 
     # Ensure callback data is valid
     if TFMarkup.confirm(result) is None:
         _logger.error("_perform_removal Invalid callback data received: %s", result)
-        utils.send_bug_message(update.callback_query.message)
+        await utils.send_bug_message_auto(update)
         return _STOPPING
 
     # Handle confirmation
     result = TFMarkup.confirm(result)
     if result:
-        context.user_data.get(_CURRENT_JOB).schedule_removal()
+        job = context.user_data.get(_CURRENT_JOB)
+        job.schedule_removal()
+        context.bot_data.get(_JOB_NAME_INDEX, set()).discard(job.name)
 
     # Final preparations
     _ = context.user_data.pop(_CURRENT_JOB)
-    update.callback_query.edit_message_text(utils.text_to_markdownv2("Job successfully removed!" if result else
-                                                                     "Removal successfully aborted!"),
-                                            parse_mode=ParseMode.MARKDOWN_V2,
-                                            reply_markup=InlineKeyboardMarkup([[
-                                                InlineKeyboardButton("OK", callback_data=_SET_REMINDER)]]))
+    await _answer_and_edit(update.callback_query, _JOB_REMOVED_TEXT if result else _REMOVAL_ABORTED_TEXT, _ok_markup())
     return _CANCEL
 
 # endregion Removing job
@@ -746,6 +840,93 @@ def _perform_removal(update: Update, context: CallbackContext) -> str:
 # region Helper functions
 
 
+class _GridAnswerState:
+    """Answers to the sub-questions of a grid-based question, in the order they are to be submitted.
+
+    The sub-questions are answered strictly in order, so a cursor to the next unanswered sub-question
+    is kept alongside the answers instead of scanning for the first unanswered one on every turn.
+    """
+
+    __slots__ = ("keys", "positions", "values", "cursor")
+
+    def __init__(self, keys: Tuple[str]) -> None:
+        self.keys = tuple(keys)
+        self.positions = {key: position for position, key in enumerate(self.keys)}
+        self.values = [None] * len(self.keys)
+        self.cursor = 0
+
+    def __repr__(self) -> str:
+        return "{}({})".format(self.__class__.__name__, dict(zip(self.keys, self.values)))
+
+    def next_unanswered(self) -> Optional[str]:
+        """Obtains the next sub-question to be answered.
+
+        :return: The next unanswered sub-question, or None if all sub-questions have been answered.
+        """
+
+        return self.keys[self.cursor] if self.cursor < len(self.keys) else None
+
+    def is_complete(self) -> bool:
+        """Checks if all sub-questions have been answered.
+
+        :return: True if all sub-questions have been answered, False otherwise.
+        """
+
+        return self.cursor == len(self.keys)
+
+    def get(self, key: str) -> Optional[Union[str, Tuple[str]]]:
+        """Obtains the answer to a sub-question.
+
+        :param key: The sub-question to obtain the answer to.
+        :return: The answer to the sub-question, or None if it is not answered or not a sub-question.
+        """
+
+        position = self.positions.get(key)
+        return None if position is None else self.values[position]
+
+    def answer(self, value: Union[str, Tuple[str]]) -> None:
+        """Answers the next unanswered sub-question.
+
+        :param value: The answer to the sub-question.
+        """
+
+        if self.cursor < len(self.keys):
+            self.values[self.cursor] = value
+            self.cursor += 1
+
+    def last_answer(self) -> Optional[Union[str, Tuple[str]]]:
+        """Obtains the answer to the most recently answered sub-question.
+
+        :return: The most recent answer, or None if no sub-questions have been answered.
+        """
+
+        return self.values[self.cursor - 1] if self.cursor else None
+
+    def replace_last(self, value: Union[str, Tuple[str]]) -> None:
+        """Replaces the answer to the most recently answered sub-question.
+
+        :param value: The new answer to the sub-question.
+        """
+
+        if self.cursor:
+            self.values[self.cursor - 1] = value
+
+    def undo(self) -> None:
+        """Resets the most recently answered sub-question back to unanswered."""
+
+        if self.cursor:
+            self.cursor -= 1
+            self.values[self.cursor] = None
+
+    def to_tuple(self) -> Tuple[Union[str, Tuple[str]]]:
+        """Obtains the answers in the order to be submitted.
+
+        :return: The answers to all sub-questions.
+        """
+
+        return tuple(self.values)
+
+
 def _submit_to_google_forms(processor: FormProcessor, *answers: Union[str, Tuple[str]]) -> Optional[bool]:
     """Parses the chosen answer(s) for submission via FormProcessor.
 
@@ -761,7 +942,7 @@ def _submit_to_google_forms(processor: FormProcessor, *answers: Union[str, Tuple
         # Sanity check
         _logger.warning("_submit_to_google_forms No answers to parse")
         return True
-    elif answers[0] == BaseOptionMarkup.get_skip() or answers[0] == "/skip":
+    elif answers[0] in _SKIP_TOKENS:
         return processor.answer_question(skip=True)
     return processor.answer_question(*answers)
 
@@ -775,20 +956,31 @@ def _remove_current_pointers(context: CallbackContext) -> None:
     :param context: The CallbackContext instance to remove the data from.
     """
 
-    keys_missing = ""
-    if _CURRENT_QUESTION in context.user_data.keys():
-        _ = context.user_data.pop(_CURRENT_QUESTION)
-    else:
-        keys_missing += "_CURRENT_QUESTION"
-    if _CURRENT_ANSWER in context.user_data.keys():
-        _ = context.user_data.pop(_CURRENT_ANSWER)
+    question = context.user_data.pop(_CURRENT_QUESTION, _MISSING)
+    answer = context.user_data.pop(_CURRENT_ANSWER, _MISSING)
+    if question is _MISSING or answer is _MISSING:
+        keys_missing = ("_CURRENT_QUESTION",) * (question is _MISSING) + ("_CURRENT_ANSWER",) * (answer is _MISSING)
+        _logger.warning("_remove_current_pointers %s not found in context.user_data", " and ".join(keys_missing))
+
+
+async def _reply(update: Update, text: str, reply_markup: Optional[InlineKeyboardMarkup] = None) -> None:
+    """Helper function to reply to the user's message or, for CallbackQueryHandlers, edit the menu message.
+
+    Replies to messages without an inline keyboard also remove any custom reply keyboard.
+
+    :param update: The update instance to respond to.
+    :param text: The MarkdownV2 text to send.
+    :param reply_markup: The inline keyboard to attach to the response, if any.
+    """
+
+    if update.message:
+        await update.message.reply_text(text, parse_mode=ParseMode.MARKDOWN_V2,
+                                        reply_markup=reply_markup or ReplyKeyboardRemove())
     else:
-        keys_missing += " and " * bool(keys_missing) + "_CURRENT_ANSWER"
-    if keys_missing:
-        _logger.warning("_remove_current_pointers %s not found in context.user_data.keys()", keys_missing)
+        await update.callback_query.edit_message_text(text, parse_mode=ParseMode.MARKDOWN_V2, reply_markup=reply_markup)
 
 
-def _show_loading_screen(callback_query: CallbackQuery) -> None:
+async def _show_loading_screen(callback_query: CallbackQuery) -> None:
     """Helper function to show a loading screen while processing in the background.
 
     This method only works for CallbackQueryHandlers.
@@ -797,15 +989,14 @@ def _show_loading_screen(callback_query: CallbackQuery) -> None:
     """
 
     try:
-        callback_query.edit_message_text(utils.text_to_markdownv2("Please wait..."), parse_mode=ParseMode.MARKDOWN_V2)
+        await callback_query.edit_message_text(_LOADING_TEXT, parse_mode=ParseMode.MARKDOWN_V2)
     except BadRequest:
         _logger.info("_show_loading_screen already displayed")
 
 # endregion Helper functions
 
 
-@_handle_background
-def _process_answer(update: Update, context: CallbackContext) -> str:
+async def _process_answer(update: Update, context: CallbackContext) -> str:
     """Handler for processing user inputs.
 
     The function obtains user input from the relevant message / markup callback data
@@ -821,49 +1012,41 @@ def _process_answer(update: Update, context: CallbackContext) -> str:
     # Check if CallbackQueryHandler called
     if update.callback_query:
         markup = context.user_data.get(_CURRENT_MARKUP)
-        try:
-            assert update.callback_query.data is not None
-            assert isinstance(markup, BaseOptionMarkup)
-        except AssertionError as error:
-            _logger.error("_process_answer AssertionError detected while processing CallbackQueryHandler:\n%s", error)
-            if update.callback_query.message:
-                utils.send_bug_message(update.callback_query.message)
+        if update.callback_query.data is None or not isinstance(markup, BaseOptionMarkup):
+            _logger.error("_process_answer sanity check failed while processing CallbackQueryHandler")
+            await utils.send_bug_message_auto(update)
             return _STOPPING
         result = markup.perform_action(update.callback_query.data)
         # Check if skip failed
         if result == BaseOptionMarkup.get_required_warning():
-            update.callback_query.answer(result)
+            await update.callback_query.answer(result)
             return _SKIP_OR_ANSWER
-        update.callback_query.answer()
+        await update.callback_query.answer()
 
     # Check if MessageHandler called
     elif update.message:
         result = update.message.text
         question = context.user_data.get(_CURRENT_QUESTION)
-        try:
-            assert isinstance(question, BaseQuestion)
-        except AssertionError as error:
-            _logger.error("_process_answer AssertionError detected while processing MessageHandler:\n%s", error)
-            utils.send_bug_message(update.message)
+        if not isinstance(question, BaseQuestion):
+            _logger.error("_process_answer sanity check failed while processing MessageHandler")
+            await utils.send_bug_message(update.message)
             return _STOPPING
 
         # Check if skip failed
-        if result == "/skip" and question.is_required():
-            update.message.reply_text(
-                utils.text_to_markdownv2("Sorry, I can't allow you to skip this question because it is required 😢"),
-                parse_mode=ParseMode.MARKDOWN_V2)
+        if result == _SLASH_SKIP and question.is_required():
+            await update.message.reply_text(_REQUIRED_SKIP_TEXT, parse_mode=ParseMode.MARKDOWN_V2)
             return _SKIP_OR_ANSWER
 
         # Check if user tried not to use the inline keyboard
         elif isinstance(context.user_data.get(_CURRENT_MARKUP), BaseOptionMarkup):
-            utils.send_potential_feature_message(update.message,
-                                                 "Sorry, please select your answer from the menu provided.")
+            await utils.send_potential_feature_message(update.message,
+                                                       "Sorry, please select your answer from the menu provided.")
             return _SKIP_OR_ANSWER
 
     # Error occurred
     # Can't use utils.send_bug_message since no message instance is found
     else:
-        _logger.error("_process_answer message class to send message not found: {}".format(update))
+        _logger.error("_process_answer message class to send message not found: %s", update)
         return _STOPPING
 
     # endregion Handling handlers
@@ -871,40 +1054,30 @@ def _process_answer(update: Update, context: CallbackContext) -> str:
     # region Determine action according to result
 
     if isinstance(result, InlineKeyboardMarkup):
-        update.callback_query.edit_message_text(utils.text_to_markdownv2(update.callback_query.message.text),
-                                                parse_mode=ParseMode.MARKDOWN_V2,
-                                                reply_markup=result)
+        await update.callback_query.edit_message_text(utils.text_to_markdownv2(update.callback_query.message.text),
+                                                      parse_mode=ParseMode.MARKDOWN_V2,
+                                                      reply_markup=result)
     elif isinstance(result, str) or isinstance(result, Tuple):
 
         # Save answer into user data
-        if isinstance(context.user_data.get(_CURRENT_ANSWER), OrderedDict):
-            keys = list(context.user_data.get(_CURRENT_ANSWER).keys())
-            for key in keys:
-                if context.user_data.get(_CURRENT_ANSWER).get(key) is None:
-                    context.user_data.get(_CURRENT_ANSWER)[key] = \
-                        "" if result == BaseOptionMarkup.get_skip() or result == "/skip" else result
-                    break
+        current_answer = context.user_data.get(_CURRENT_ANSWER)
+        if isinstance(current_answer, _GridAnswerState):
+            current_answer.answer("" if result in _SKIP_TOKENS else result)
         else:
             context.user_data[_CURRENT_ANSWER] = result
 
         # Check if 'Other' option is selected
-        if BaseOptionQuestion.get_other_option_label() in result:
-            text = utils.text_to_markdownv2("Please specify your alternative option:")
-            if update.message:
-                update.message.reply_text(text, parse_mode=ParseMode.MARKDOWN_V2, reply_markup=ReplyKeyboardRemove())
-            else:
-                update.callback_query.edit_message_text(text, parse_mode=ParseMode.MARKDOWN_V2)
+        # Questions without an 'Other' option skip the scan of the answer
+        question = context.user_data.get(_CURRENT_QUESTION)
+        has_other = isinstance(question, BaseOptionQuestion) and question.is_other_option_defined()
+        if has_other and _OTHER_LABEL in result:
+            await _reply(update, _SPECIFY_OTHER_TEXT)
             return _ANSWER_OTHER
 
         # Prompt for user input
-        text = utils.text_to_markdownv2("Are you sure you want to skip this question?"
-                                        if result == BaseOptionMarkup.get_skip() or result == "/skip" else
-                                        "Please confirm your answer:\n{}".format(result))
-        tf_markup = TFMarkup.get_markup()
-        if update.message:
-            update.message.reply_text(text, parse_mode=ParseMode.MARKDOWN_V2, reply_markup=tf_markup)
-        else:
-            update.callback_query.edit_message_text(text, parse_mode=ParseMode.MARKDOWN_V2, reply_markup=tf_markup)
+        text = _CONFIRM_SKIP_TEXT if result in _SKIP_TOKENS else \
+            utils.text_to_markdownv2("Please confirm your answer:\n{}".format(result))
+        await _reply(update, text, _tf_markup())
         return _CONFIRM_SUBMIT
 
     return _SKIP_OR_ANSWER
@@ -912,12 +1085,50 @@ def _process_answer(update: Update, context: CallbackContext) -> str:
     # endregion Determine action according to result
 
 
+class _UserPatternHandler(CallbackQueryHandler):
+    """CallbackQueryHandler which matches callback data against a pattern set separately for each user.
+
+    The patterns are stored by user ID, so updating the pattern for one user's conversation
+    (or clearing it after a failed scheduled job) does not affect what is accepted from any other user.
+    Users without a pattern have none of their callback queries accepted.
+    """
+
+    __slots__ = ("user_patterns",)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.user_patterns: Dict[int, Pattern] = {}
+
+    def set_pattern(self, user_id: int, pattern: Optional[Pattern]) -> None:
+        """Sets the pattern to match callback data from the user against.
+
+        :param user_id: The ID of the user to set the pattern for.
+        :param pattern: The compiled pattern to match, or None to stop accepting callback data from the user.
+        """
+
+        if pattern is None:
+            _ = self.user_patterns.pop(user_id, None)
+        else:
+            self.user_patterns[user_id] = pattern
+
+    def check_update(self, update: object) -> bool:
+        """Determines whether the update should be handled.
+
+        :param update: The update instance to check.
+        :return: True if the callback data matches the pattern set for the user, False otherwise.
+        """
+
+        if not isinstance(update, Update) or not (update.callback_query and update.callback_query.data):
+            return False
+        pattern = self.user_patterns.get(update.callback_query.from_user.id)
+        return pattern is not None and pattern.match(update.callback_query.data) is not None
+
+
 # Dynamic CallbackQueryHandler
-answer_handler = CallbackQueryHandler(_process_answer, pattern="^$")
+answer_handler = _UserPatternHandler(_process_answer)
 
 
-@_handle_background
-def _process_other(update: Update, context: CallbackContext) -> str:
+async def _process_other(update: Update, context: CallbackContext) -> str:
     """Handler for processing selection for specified 'Other' option.
 
     :param update: The update instance to process the 'Other' option selection.
@@ -927,12 +1138,9 @@ def _process_other(update: Update, context: CallbackContext) -> str:
 
     # region Initialisation
 
-    try:
-        assert _CURRENT_MARKUP in context.user_data.keys()
-        assert _CURRENT_ANSWER in context.user_data.keys()
-    except AssertionError as error:
-        _logger.error("_process_other AssertionError detected while trying to initialise:\n%s", error)
-        utils.send_bug_message(update.message)
+    if _CURRENT_MARKUP not in context.user_data or _CURRENT_ANSWER not in context.user_data:
+        _logger.error("_process_other sanity check failed while trying to initialise")
+        await utils.send_bug_message(update.message)
         return _STOPPING
 
     # endregion Initialisation
@@ -940,39 +1148,31 @@ def _process_other(update: Update, context: CallbackContext) -> str:
     # region Save answer
 
     result = context.user_data.get(_CURRENT_ANSWER)
-    curr_key = None
-    if isinstance(result, OrderedDict):
-        for key in list(result.keys()):
-            if BaseOptionQuestion.get_other_option_label() in result.get(key):
-                curr_key = key
-                result = result.get(key)
-                break
+    grid_answer = None
+    if isinstance(result, _GridAnswerState):
+        # The 'Other' option can only have been selected for the most recently answered sub-question
+        grid_answer, result = result, result.last_answer()
 
     if isinstance(result, str):
         result = update.message.text
     else:
-        result = list(context.user_data.get(_CURRENT_ANSWER))
-        result[result.index(BaseOptionQuestion.get_other_option_label())] = update.message.text
+        result = list(result)
+        result[result.index(_OTHER_LABEL)] = update.message.text
         result = tuple(result)
-    if curr_key:
-        context.user_data.get(_CURRENT_ANSWER)[curr_key] = result
+    if grid_answer is not None:
+        grid_answer.replace_last(result)
     else:
         context.user_data[_CURRENT_ANSWER] = result
 
     # endregion Save answer
 
     # Prompt for user input
-    text = utils.text_to_markdownv2("Please confirm your answer:\n{}".format(result))
-    tf_markup = TFMarkup.get_markup()
-    if update.message:
-        update.message.reply_text(text, parse_mode=ParseMode.MARKDOWN_V2, reply_markup=tf_markup)
-    else:
-        update.callback_query.edit_message_text(text, parse_mode=ParseMode.MARKDOWN_V2, reply_markup=tf_markup)
+    await _reply(update, utils.text_to_markdownv2("Please confirm your answer:\n{}".format(result)),
+                 _tf_markup())
     return _CONFIRM_SUBMIT
 
 
-@_handle_background
-def _obtain_question(update: Update, context: CallbackContext, *, to_process: Optional[bool] = True) -> str:
+async def _obtain_question(update: Update, context: CallbackContext, *, to_process: Optional[bool] = True) -> str:
     """Handler for obtaining Google Form questions.
 
     The function obtains the next question to be processed (or remains at the current question instance,
@@ -986,73 +1186,89 @@ def _obtain_question(update: Update, context: CallbackContext, *, to_process: Op
 
     # region Initialisation
 
-    global answer_handler
-    global confirm_handler
-    try:
-        assert update.callback_query
-        assert _PROCESSOR in context.user_data.keys()
-    except AssertionError as error:
-        _logger.error("_obtain_question AssertionError detected while trying to initialise:\n%s", error)
-        if update.callback_query.message:
-            utils.send_bug_message(update.callback_query.message)
-        elif update.message:
-            utils.send_bug_message(update.message)
+    if not update.callback_query or _PROCESSOR not in context.user_data:
+        _logger.error("_obtain_question sanity check failed while trying to initialise")
+        await utils.send_bug_message_auto(update)
         return _STOPPING
-    _show_loading_screen(update.callback_query)
+    await _show_loading_screen(update.callback_query)
 
     # endregion Initialisation
 
+    # Questions submitted automatically with saved answers continue the loop instead of recursing,
+    # so the loading screen is only shown once
+    state = await _process_question(update, context, to_process=to_process)
+    while state == _CONTINUE:
+        state = await _process_question(update, context)
+    return state
+
+
+async def _process_question(update: Update, context: CallbackContext, *, to_process: Optional[bool] = True) -> str:
+    """Helper function to obtain the next Google Form question and display its metadata.
+
+    :param update: The update instance to obtain the Google Form question.
+    :param context: The CallbackContext instance to obtain the Google Form question.
+    :param to_process: Flag to indicate if the question should be processed.
+    :return: The _CONTINUE state if the question was submitted automatically,
+             otherwise the relevant state for further processing.
+    """
+
+    global answer_handler
+    global confirm_handler
+
     # region Obtain the next Google Form question
 
     # Obtain FormProcessor
     processor = context.user_data.get(_PROCESSOR)
     start = False
     if not isinstance(processor, FormProcessor):
-        assert isinstance(processor, str)
-        processor = FormProcessor(processor, headless=True)
+        if not isinstance(processor, str):
+            _logger.error("_obtain_question unable to obtain FormProcessor or Google Form link: %s", processor)
+            await utils.send_bug_message_auto(update)
+            return _STOPPING
+        processor = await asyncio.to_thread(FormProcessor, processor, headless=True)
         context.user_data[_PROCESSOR] = processor
         start = True
         # Check if callback query (from main menu or scheduled job) is still valid
         try:
-            update.callback_query.answer()
+            await update.callback_query.answer()
         except BadRequest:
             _logger.info("_obtain_question update.callback_query has expired, no need to answer")
 
     # Initialise new question instance based on Google Form question
-    if _CURRENT_QUESTION not in context.user_data.keys():
-        question = processor.get_question(start)
+    if _CURRENT_QUESTION not in context.user_data:
+        question = await asyncio.to_thread(processor.get_question, start)
         if question is True:
             # No more questions, exit back to main menu
-            update.callback_query.edit_message_text(
-                utils.text_to_markdownv2("🥳 The form has submitted successfully! 🥳"),
+            await update.callback_query.edit_message_text(
+                _FORM_SUBMITTED_TEXT,
                 parse_mode=ParseMode.MARKDOWN_V2,
-                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton(
-                    utils.text_to_markdownv2("Return to main menu"), callback_data=_RETURN_CALLBACK_DATA)]])
+                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton(_RETURN_TO_MAIN_MENU_TEXT,
+                                                                         callback_data=_RETURN_CALLBACK_DATA)]])
             )
-            processor.get_browser().close_browser()
+            await asyncio.to_thread(processor.get_browser().close_browser)
             context.user_data[_PROCESSOR] = processor.get_browser().get_link()
-            answer_handler.pattern = re.compile("^$")
+            answer_handler.set_pattern(update.effective_user.id, None)
             return _RETURN
         elif question is False or not isinstance(question, BaseQuestion):
             # Some error occurred
             _logger.error("_obtain_question error occurred while trying to obtain the next question")
-            utils.send_bug_message(update.callback_query.message)
+            await utils.send_bug_message_auto(update)
             return _STOPPING
 
         # Process the question
         context.user_data[_CURRENT_QUESTION] = question
-        result = question.get_info()
+        result = await asyncio.to_thread(question.get_info)
         while result is False:
             # Re-crawl the web page to obtain a new question element
-            element = processor.refresh_section()
+            element = await asyncio.to_thread(processor.refresh_section)
             if not element:
                 result = None
                 break
             question.set_question_element(element)
-            result = question.get_info()
+            result = await asyncio.to_thread(question.get_info)
         if not result:
             _logger.error("_obtain_question error occurred while trying to obtain the question information")
-            utils.send_bug_message(update.callback_query.message)
+            await utils.send_bug_message_auto(update)
             return _STOPPING
 
     # Retrieve question instance if it has been stored previously
@@ -1062,125 +1278,136 @@ def _obtain_question(update: Update, context: CallbackContext, *, to_process: Op
             _logger.error("_obtain_question retrieving question that is not a question instance: %s", question)
             question = None
         if not question:
-            utils.send_bug_message(update.callback_query.message)
+            await utils.send_bug_message_auto(update)
             return _STOPPING
 
     # endregion Obtain the next Google Form question
 
+    pref_key = question.get_pref_key()
+    required = question.is_required()
+
     # region Obtain previously-stored answer, if any
 
     # Only process preferences if its a new question being processed and there are preferences stored
-    answer, preference = None, None
-    if to_process and _SAVE_PREFS in context.user_data.keys():
+    answer, preference, prefs, header_index = None, None, None, None
+    if to_process:
+        try:
+            prefs = context.user_data[_SAVE_PREFS][_LOCAL_SAVE_PREF]
+        except KeyError:
+            pass
 
         # Check local preference first; it takes precedence over global preference
-        if _LOCAL_SAVE_PREF in context.user_data.get(_SAVE_PREFS, {}).keys():
-            prefs = context.user_data.get(_SAVE_PREFS, {}).get(_LOCAL_SAVE_PREF, {})
+        if prefs is not None:
+
+            # Sanity check: the header index is created together with the question preferences
+            header_index = context.user_data.get(_PREF_HEADER_INDEX)
+            if header_index is None:
+                _logger.error("_obtain_question sanity check failed, question preferences are not indexed by header")
+                await utils.send_bug_message_auto(update)
+                return _STOPPING
 
             # Check if there is a direct match
             # If so, operate on the answer and the corresponding preference
-            if question.get_pref_key() in prefs.keys():
+            if pref_key in prefs:
 
                 # Obtain answer and preference
-                try:
-                    assert _PREF_KEY in prefs.get(question.get_pref_key(), {}).keys()
-                    preference = prefs.get(question.get_pref_key(), {}).get(_PREF_KEY)
-                    answer = prefs.get(question.get_pref_key(), {}).get(_ANSWER_KEY)
-                except AssertionError:
-                    _logger.error("AssertionError in _obtain_question while obtaining preference, please debug")
-                    utils.send_bug_message(update.callback_query.message)
+                question_pref = prefs[pref_key]
+                if _PREF_KEY not in question_pref:
+                    _logger.error("_obtain_question preference not found while obtaining preference, please debug")
+                    await utils.send_bug_message_auto(update)
                     return _STOPPING
+                preference = question_pref[_PREF_KEY]
+                answer = question_pref.get(_ANSWER_KEY)
 
                 # Determine action based on answer and preference
                 if not SavePrefMarkup.is_option(preference):
                     _logger.error("_obtain_question obtained preference which is not defined: %s", preference)
-                    utils.send_bug_message(update.callback_query.message)
+                    await utils.send_bug_message_auto(update)
                     return _STOPPING
                 if answer:
                     if preference == SavePrefMarkup.get_save_always():
-                        if isinstance(answer, OrderedDict):
-                            result = _submit_to_google_forms(processor, *answer.values())
+                        if isinstance(answer, _GridAnswerState):
+                            result = await asyncio.to_thread(_submit_to_google_forms, processor, *answer.to_tuple())
                         elif isinstance(answer, tuple):
-                            result = _submit_to_google_forms(processor, *answer)
+                            result = await asyncio.to_thread(_submit_to_google_forms, processor, *answer)
                         else:
-                            result = _submit_to_google_forms(processor, str(answer))
+                            result = await asyncio.to_thread(_submit_to_google_forms, processor, str(answer))
                         if result:
                             _remove_current_pointers(context)
-                            return _obtain_question(update, context)  # Process the next question
+                            return _CONTINUE  # Process the next question
                         else:
                             _logger.error("_obtain_question failed to submit to google forms, please debug")
                             return _STOPPING
                     elif preference == SavePrefMarkup.get_never_save():
                         # There should not be any saved answers
                         _logger.warning("_obtain_question obtained preference of never save but answer is recorded, "
-                                        "please debug: key=%s, answer=%s", question.get_pref_key(), answer)
+                                        "please debug: key=%s, answer=%s", pref_key, answer)
 
             # Else, check if there is a close match
             # A close match is defined as a question header match,
             # with either the description or the required flag mismatch (but not both)
             else:
-                for pref_key in prefs.keys():
-                    try:
-                        assert isinstance(pref_key, tuple) and len(pref_key) == 3
-                        header, description, required = question.get_pref_key()
-                        if header == pref_key[0] and (description == pref_key[1] or required == pref_key[2]):
-                            answer = prefs.get(pref_key, {}).get(_ANSWER_KEY)
-                            # Discard preference; answer will be recommended to user
-                            break
-                    except AssertionError as error:
-                        _logger.error("_obtain_question AssertionError detected while obtaining preference, "
-                                      "please debug:\n%s", error)
-                        utils.send_bug_message(update.callback_query.message)
-                        return _STOPPING
+                header, description, is_required = pref_key
+                for saved_key in header_index.get(header, ()):
+                    saved_pref = prefs.get(saved_key)
+                    if saved_pref is not None and (description == saved_key[1] or is_required == saved_key[2]):
+                        answer = saved_pref.get(_ANSWER_KEY)
+                        # Discard preference; answer will be recommended to user
+                        break
 
     # endregion Obtain previously-stored answer, if any
 
     # region Display the question metadata
 
-    text = "{}\n" \
-           "==============\n" \
-           "{}{}".format(question.get_header(),
-                         question.get_description() if question.get_description() else "(no description)",
-                         "\n\nThis is a required question." if question.is_required() else "")
+    text = [question.get_header() or _PROMPT_NO_HEADER, _PROMPT_DIVIDER,
+            question.get_description() or _PROMPT_NO_DESCRIPTION]
+    if required:
+        text.append(_PROMPT_REQUIRED)
 
     # Format sub-question for grid-based questions
     sub_question = None
     if isinstance(question, BaseOptionGridQuestion):
-        if _CURRENT_ANSWER not in context.user_data.keys():
-            context.user_data[_CURRENT_ANSWER] = OrderedDict((q, None) for q in question.get_sub_questions())
+        if _CURRENT_ANSWER not in context.user_data:
+            context.user_data[_CURRENT_ANSWER] = _GridAnswerState(question.get_sub_questions())
 
         # Obtain the next sub-question to process
-        for key, value in context.user_data.get(_CURRENT_ANSWER, OrderedDict()).items():
-            if value is None:
-                sub_question = key
-                break
+        current_answer = context.user_data.get(_CURRENT_ANSWER)
+        if isinstance(current_answer, _GridAnswerState):
+            sub_question = current_answer.next_unanswered()
         if sub_question is None:
             _logger.error("_obtain_question unable to find next sub-question to process\n"
-                          "sub_questions: %s", context.user_data.get(_CURRENT_ANSWER, OrderedDict()))
-            utils.send_bug_message(update.callback_query.message)
+                          "sub_questions: %s", current_answer)
+            await utils.send_bug_message_auto(update)
             return _STOPPING
-        text += "\n\nProcessing answer for {}.".format(sub_question)
+        text.append(_PROMPT_SUB_QUESTION.format(sub_question))
 
         # Obtain relevant saved answer, if any
-        if answer and not isinstance(answer, OrderedDict):
+        if answer and not isinstance(answer, _GridAnswerState):
             _logger.warning("_obtain_question unexpected saved answer for %s\n"
                             "question=%s, answer=%s", question.__class__.__name__, question, answer)
-            _ = context.user_data.get(_SAVE_PREFS, {}).get(_LOCAL_SAVE_PREF, {}).pop(question.get_pref_key())
+            if prefs.pop(pref_key, None) is not None:
+                header_index[pref_key[0]].remove(pref_key)
             answer = None
+        elif answer:
+            # A sub-question without a saved answer falls through to prompt the user
+            answer = answer.get(sub_question)
 
     # Format saved answers
     if to_process and bool(answer):
-        if _CURRENT_ANSWER not in context.user_data.keys():
+        if _CURRENT_ANSWER not in context.user_data:
             context.user_data[_CURRENT_ANSWER] = answer
 
-        # Obtain relevant saved answer from grid-based question, if any
+        # Record the saved answer against the current sub-question
         if isinstance(question, BaseOptionGridQuestion):
-            assert isinstance(answer, OrderedDict) and isinstance(context.user_data.get(_CURRENT_ANSWER), OrderedDict)
-            answer = answer.get(sub_question)
-            context.user_data.get(_CURRENT_ANSWER)[sub_question] = answer
+            if not isinstance(context.user_data.get(_CURRENT_ANSWER), _GridAnswerState):
+                _logger.error("_obtain_question unexpected answer for grid-based question: %s",
+                              context.user_data.get(_CURRENT_ANSWER))
+                await utils.send_bug_message_auto(update)
+                return _STOPPING
+            context.user_data.get(_CURRENT_ANSWER).answer(answer)
 
         # Format answer
-        if answer == BaseOptionMarkup.get_skip() or not answer:
+        if answer == _SKIP_LABEL or not answer:
             answer_text = "Skipping the question"
         elif isinstance(answer, str):
             answer_text = answer
@@ -1190,62 +1417,55 @@ def _obtain_question(update: Update, context: CallbackContext, *, to_process: Op
 
         if preference == SavePrefMarkup.get_ask_again():
             # Based on user preference, ask to use saved answer
-            text += "\n\n💡 SAVED ANSWER DETECTED 💡\n" \
-                    "I've previously saved the following answer:\n" \
-                    "{}\n" \
-                    "Would you like to submit this answer?".format(answer_text)
+            text.append(_PROMPT_SAVED_ANSWER.format(answer_text))
         else:
             # Found close match; recommend answer to user
-            text += "\n\n💡 ANSWER RECOMMENDATION 💡\n" \
-                    "Based on the question, I recommend:\n" \
-                    "{}\n" \
-                    "Would you like to accept my recommendation?".format(answer_text)
+            text.append(_PROMPT_RECOMMENDATION.format(answer_text))
 
         # Prompt user for confirmation
-        update.callback_query.edit_message_text(utils.text_to_markdownv2(text),
-                                                parse_mode=ParseMode.MARKDOWN_V2,
-                                                reply_markup=TFMarkup.get_markup())
-        confirm_handler.pattern = re.compile(TFMarkup.get_pattern())
+        await update.callback_query.edit_message_text(utils.text_to_markdownv2("".join(text)),
+                                                      parse_mode=ParseMode.MARKDOWN_V2,
+                                                      reply_markup=_tf_markup())
+        confirm_handler.set_pattern(update.effective_user.id, _TF_PATTERN)
         return _CONFIRM_SUBMIT
 
     # Obtain appropriate markup
     markup = None
-    if _CURRENT_MARKUP in context.user_data.keys():
+    if _CURRENT_MARKUP in context.user_data:
         markup = context.user_data.get(_CURRENT_MARKUP)
         if not isinstance(markup, BaseOptionMarkup):
             _logger.error("_obtain_question markup obtained is invalid: %s", markup)
             return _STOPPING
     else:
         if isinstance(question, DatetimeQuestion):
-            markup = DatetimeMarkup(question.is_required())
+            markup = DatetimeMarkup(required)
         elif isinstance(question, DateQuestion):
-            markup = DateMarkup(question.is_required())
+            markup = DateMarkup(required)
         elif isinstance(question, TimeQuestion):
-            markup = TimeMarkup(question.is_required())
+            markup = TimeMarkup(required)
         elif isinstance(question, DurationQuestion):
-            markup = TimeMarkup(question.is_required(), second=0)
+            markup = TimeMarkup(required, second=0)
         elif isinstance(question, BaseOptionQuestion):
-            markup = MenuMarkup(question.is_required(), isinstance(question, CheckboxQuestion), *question.get_options())
+            markup = MenuMarkup(required, isinstance(question, CheckboxQuestion), *question.get_options())
         context.user_data[_CURRENT_MARKUP] = markup
     if markup:
-        answer_handler.pattern = re.compile(markup.get_pattern())
+        answer_handler.set_pattern(update.effective_user.id, _compile_pattern(markup.get_pattern()))
         markup = markup.get_markup()
 
     # Prompt user for selection / input
-    text += "\n\nPlease {} your answer.".format("select" if isinstance(question, BaseOptionQuestion) else "input")
-    if not question.is_required():
-        text += "\nTo skip the question,{} type '/skip'.".format(" select the 'Skip' option or"
-                                                                 if isinstance(question, BaseOptionQuestion) else "")
-    update.callback_query.edit_message_text(utils.text_to_markdownv2(text),
-                                            parse_mode=ParseMode.MARKDOWN_V2,
-                                            reply_markup=markup)
+    is_option = isinstance(question, BaseOptionQuestion)
+    text.append(_PROMPT_SELECT if is_option else _PROMPT_INPUT)
+    if not required:
+        text.append(_PROMPT_SKIP_OPTION if is_option else _PROMPT_SKIP_INPUT)
+    await update.callback_query.edit_message_text(utils.text_to_markdownv2("".join(text)),
+                                                  parse_mode=ParseMode.MARKDOWN_V2,
+                                                  reply_markup=markup)
     return _SKIP_OR_ANSWER
 
     # endregion Display the question metadata
 
 
-@_handle_background
-def _submit_answer(update: Update, context: CallbackContext) -> str:
+async def _submit_answer(update: Update, context: CallbackContext) -> str:
     """Handler for submitting answers.
 
     After the user confirms the input, the function submits it to the Google Form
@@ -1259,22 +1479,18 @@ def _submit_answer(update: Update, context: CallbackContext) -> str:
     # region Initialisation
 
     global confirm_handler
-    try:
-        assert update.callback_query.data is not None
-        assert _CURRENT_ANSWER in context.user_data.keys()
-        assert isinstance(context.user_data.get(_CURRENT_QUESTION), BaseQuestion)
-        assert isinstance(context.user_data.get(_PROCESSOR), FormProcessor)
-    except AssertionError as error:
-        _logger.error("_submit_answer AssertionError detected while trying to initialise:\n%s", error)
-        if update.callback_query.message:
-            utils.send_bug_message(update.callback_query.message)
-        elif update.message:
-            utils.send_bug_message(update.message)
+    current_answer = context.user_data.get(_CURRENT_ANSWER)
+    question = context.user_data.get(_CURRENT_QUESTION)
+    processor = context.user_data.get(_PROCESSOR)
+    if not (update.callback_query and update.callback_query.data is not None) or \
+            _CURRENT_ANSWER not in context.user_data or not isinstance(question, BaseQuestion) or \
+            not isinstance(processor, FormProcessor):
+        _logger.error("_submit_answer sanity check failed while trying to initialise")
+        await utils.send_bug_message_auto(update)
         return _STOPPING
-    update.callback_query.answer()
-    if _CURRENT_MARKUP in context.user_data.keys():
-        _ = context.user_data.pop(_CURRENT_MARKUP)
-    confirm_handler.pattern = re.compile("^$")
+    await update.callback_query.answer()
+    _ = context.user_data.pop(_CURRENT_MARKUP, None)
+    confirm_handler.set_pattern(update.effective_user.id, None)
 
     # endregion Initialisation
 
@@ -1285,97 +1501,81 @@ def _submit_answer(update: Update, context: CallbackContext) -> str:
         _logger.error("_submit_answer obtained unrecognised callback data: %s", update.callback_query.data)
         return _STOPPING
     elif result:
-        if isinstance(context.user_data.get(_CURRENT_ANSWER), OrderedDict) and \
-                None in context.user_data.get(_CURRENT_ANSWER).values():
-            return _obtain_question(update, context)  # Process next sub-question in _CURRENT_QUESTION
+        if isinstance(current_answer, _GridAnswerState) and not current_answer.is_complete():
+            return await _obtain_question(update, context)  # Process next sub-question in _CURRENT_QUESTION
         else:
-            _show_loading_screen(update.callback_query)
-            if isinstance(context.user_data.get(_CURRENT_ANSWER), OrderedDict):
-                result = _submit_to_google_forms(context.user_data.get(_PROCESSOR),
-                                                 *context.user_data.get(_CURRENT_ANSWER).values())
-            elif isinstance(context.user_data.get(_CURRENT_ANSWER), tuple):
-                result = _submit_to_google_forms(context.user_data.get(_PROCESSOR),
-                                                 *context.user_data.get(_CURRENT_ANSWER))
+            await _show_loading_screen(update.callback_query)
+            if isinstance(current_answer, _GridAnswerState):
+                result = await asyncio.to_thread(_submit_to_google_forms, processor, *current_answer.to_tuple())
+            elif isinstance(current_answer, tuple):
+                result = await asyncio.to_thread(_submit_to_google_forms, processor, *current_answer)
             else:
-                result = _submit_to_google_forms(context.user_data.get(_PROCESSOR),
-                                                 str(context.user_data.get(_CURRENT_ANSWER)))
+                result = await asyncio.to_thread(_submit_to_google_forms, processor, str(current_answer))
             if not result:
                 _logger.error("_submit_answer failed to submit answer to Google forms, please debug")
                 return _STOPPING
     else:
-        if isinstance(context.user_data.get(_CURRENT_ANSWER), OrderedDict):
-            for key in list(context.user_data.get(_CURRENT_ANSWER).keys())[::-1]:
-                if context.user_data.get(_CURRENT_ANSWER).get(key) is not None:
-                    # Reset answer back to None
-                    context.user_data.get(_CURRENT_ANSWER)[key] = None
-                    break
-        return _obtain_question(update, context, to_process=False)  # Process current question in _CURRENT_QUESTION
+        if isinstance(current_answer, _GridAnswerState):
+            # Reset answer back to None
+            current_answer.undo()
+        # Process current question in _CURRENT_QUESTION
+        return await _obtain_question(update, context, to_process=False)
 
     # endregion Confirm submission
 
     # region Save answer
 
     # Determine answer save preference
-    question = context.user_data.get(_CURRENT_QUESTION)
-    default = {
-        _GLOBAL_SAVE_PREF: SavePrefMarkup.get_ask_again(),
-        _LOCAL_SAVE_PREF: {
-            question.get_pref_key(): {
-                _PREF_KEY: context.user_data.get(_SAVE_PREFS, {}).get(
-                    _GLOBAL_SAVE_PREF, SavePrefMarkup.get_ask_again())
-            }
+    save_prefs = context.user_data.get(_SAVE_PREFS)
+    if save_prefs is None:
+        save_prefs = context.user_data[_SAVE_PREFS] = {_GLOBAL_SAVE_PREF: SavePrefMarkup.get_ask_again()}
+    local_save_pref = save_prefs.get(_LOCAL_SAVE_PREF)
+    if local_save_pref is None:
+        local_save_pref = save_prefs[_LOCAL_SAVE_PREF] = {}
+        context.user_data[_PREF_HEADER_INDEX] = {}
+    header_index = context.user_data.get(_PREF_HEADER_INDEX)
+    if header_index is None:
+        _logger.error("_submit_answer sanity check failed, question preferences are not indexed by header")
+        await utils.send_bug_message_auto(update)
+        return _STOPPING
+    pref_key = question.get_pref_key()
+    question_pref = local_save_pref.get(pref_key)
+    if question_pref is None:
+        question_pref = local_save_pref[pref_key] = {
+            _PREF_KEY: save_prefs.get(_GLOBAL_SAVE_PREF, SavePrefMarkup.get_ask_again())
         }
-    }
-    if _SAVE_PREFS not in context.user_data.keys():
-        context.user_data[_SAVE_PREFS] = default
-    elif _LOCAL_SAVE_PREF not in context.user_data.get(_SAVE_PREFS, {}).keys():
-        context.user_data.get(_SAVE_PREFS, {})[_LOCAL_SAVE_PREF] = default.get(_LOCAL_SAVE_PREF)
-    elif question.get_pref_key() not in context.user_data.get(_SAVE_PREFS, {}).get(_LOCAL_SAVE_PREF, {}).keys():
-        context.user_data.get(_SAVE_PREFS, {}).get(_LOCAL_SAVE_PREF, {})[question.get_pref_key()] = \
-            default.get(_LOCAL_SAVE_PREF).get(question.get_pref_key())
-    question_pref = context.user_data.get(_SAVE_PREFS, {}).get(_LOCAL_SAVE_PREF, {}).get(question.get_pref_key())
+        header_index.setdefault(pref_key[0], []).append(pref_key)
 
     # Save answer according to preference
     if not SavePrefMarkup.is_option(question_pref.get(_PREF_KEY)):
         _logger.error("_submit_answer obtained preference which is not defined: %s", question_pref.get(_PREF_KEY))
-        utils.send_bug_message(update.callback_query.message)
+        await utils.send_bug_message_auto(update)
         return _STOPPING
     elif question_pref.get(_PREF_KEY) == SavePrefMarkup.get_save_always():
         # Automatically save answer and continue
-        question_pref[_ANSWER_KEY] = context.user_data.get(_CURRENT_ANSWER)
-        update.callback_query.edit_message_text(
-            utils.text_to_markdownv2("Your answer has been automatically saved!"),
-            parse_mode=ParseMode.MARKDOWN_V2
-        )
+        question_pref[_ANSWER_KEY] = current_answer
+        await update.callback_query.edit_message_text(_ANSWER_SAVED_TEXT, parse_mode=ParseMode.MARKDOWN_V2)
         _remove_current_pointers(context)
-        return _obtain_question(update, context)  # Process the next question
+        return await _obtain_question(update, context)  # Process the next question
     elif question_pref.get(_PREF_KEY) == SavePrefMarkup.get_never_save():
         # No answers to be saved, continue
-        update.callback_query.edit_message_text(
-            utils.text_to_markdownv2("Your answer has been automatically discarded!"),
-            parse_mode=ParseMode.MARKDOWN_V2
-        )
+        await update.callback_query.edit_message_text(_ANSWER_DISCARDED_TEXT, parse_mode=ParseMode.MARKDOWN_V2)
         _remove_current_pointers(context)
-        return _obtain_question(update, context)  # Process the next question
+        return await _obtain_question(update, context)  # Process the next question
     else:
         # Prompt for confirmation of saving of answer
-        update.callback_query.edit_message_text(
-            utils.text_to_markdownv2("💡 SAVE ANSWER PROMPT 💡\n"
-                                     "Would you like me to save your answer to this question for future submissions?"),
-            parse_mode=ParseMode.MARKDOWN_V2,
-            reply_markup=TFMarkup.get_markup()
-        )
+        await update.callback_query.edit_message_text(_SAVE_ANSWER_PROMPT_TEXT, parse_mode=ParseMode.MARKDOWN_V2,
+                                                      reply_markup=_tf_markup())
         return _SAVE_ANSWER
 
     # endregion Save answer
 
 
 # Dynamic CallbackQueryHandler
-confirm_handler = CallbackQueryHandler(_submit_answer, pattern="^$")
+confirm_handler = _UserPatternHandler(_submit_answer)
 
 
-@_handle_background
-def _save_answer(update: Update, context: CallbackContext) -> str:
+async def _save_answer(update: Update, context: CallbackContext) -> str:
     """Confirms whether or not to save user answer.
 
     :param update: The update instance to confirm saving of answer.
@@ -1385,21 +1585,20 @@ def _save_answer(update: Update, context: CallbackContext) -> str:
 
     # region Initialisation
 
-    local_save_pref = context.user_data.get(_SAVE_PREFS, {}).get(_LOCAL_SAVE_PREF, {})
-    try:
-        assert update.callback_query.data is not None
-        assert _CURRENT_ANSWER in context.user_data.keys()
-        question = context.user_data.get(_CURRENT_QUESTION)
-        assert isinstance(question, BaseQuestion)
-        assert local_save_pref.get(question.get_pref_key(), {}).get(_PREF_KEY) == SavePrefMarkup.get_ask_again()
-    except AssertionError as error:
-        _logger.error("_save_answer AssertionError detected while trying to initialise:\n%s", error)
-        if update.callback_query.message:
-            utils.send_bug_message(update.callback_query.message)
-        elif update.message:
-            utils.send_bug_message(update.message)
+    question = context.user_data.get(_CURRENT_QUESTION)
+    question_pref = None
+    if isinstance(question, BaseQuestion):
+        try:
+            question_pref = context.user_data[_SAVE_PREFS][_LOCAL_SAVE_PREF][question.get_pref_key()]
+        except KeyError:
+            pass
+    if not (update.callback_query and update.callback_query.data is not None) or \
+            _CURRENT_ANSWER not in context.user_data or question_pref is None or \
+            question_pref.get(_PREF_KEY) != SavePrefMarkup.get_ask_again():
+        _logger.error("_save_answer sanity check failed while trying to initialise")
+        await utils.send_bug_message_auto(update)
         return _STOPPING
-    update.callback_query.answer()
+    await update.callback_query.answer()
 
     # endregion Initialisation
 
@@ -1408,17 +1607,17 @@ def _save_answer(update: Update, context: CallbackContext) -> str:
         _logger.error("_save_answer obtained unrecognised callback data: %s", update.callback_query.data)
         return _STOPPING
     elif result:
-        local_save_pref.get(question.get_pref_key(), {})[_ANSWER_KEY] = context.user_data.get(_CURRENT_ANSWER)
+        question_pref[_ANSWER_KEY] = context.user_data.get(_CURRENT_ANSWER)
     _remove_current_pointers(context)
-    return _obtain_question(update, context)  # Process the next question
+    return await _obtain_question(update, context)  # Process the next question
 
 # endregion Processing form
 
 # region Terminating functions
 
 
-@_handle_background
-def _stop_helper(update: Update, context: CallbackContext, message: str, to_return: Union[int, str]) -> Union[int, str]:
+async def _stop_helper(update: Update, context: CallbackContext, message: str,
+                       to_return: Union[int, str]) -> Union[int, str]:
     """Helper function to completely end conversation.
 
     :param update: The update instance that issued the /stop command.
@@ -1433,16 +1632,16 @@ def _stop_helper(update: Update, context: CallbackContext, message: str, to_retu
 
     # Check if CallbackQueryHandler called
     if update.callback_query:
-        update.callback_query.answer()
-        update.callback_query.edit_message_text(text, parse_mode=ParseMode.MARKDOWN_V2)
+        await update.callback_query.answer()
+        await update.callback_query.edit_message_text(text, parse_mode=ParseMode.MARKDOWN_V2)
 
     # Check if MessageHandler called
     elif update.message:
-        update.message.reply_text(text, parse_mode=ParseMode.MARKDOWN_V2, reply_markup=ReplyKeyboardRemove())
+        await update.message.reply_text(text, parse_mode=ParseMode.MARKDOWN_V2, reply_markup=ReplyKeyboardRemove())
 
     # Error occurred
     else:
-        _logger.error("Message class to send message not found: {}".format(update))
+        _logger.error("Message class to send message not found: %s", update)
         # Can't use utils.send_bug_message since no message instance is found
 
     # Final preparations
@@ -1450,7 +1649,7 @@ def _stop_helper(update: Update, context: CallbackContext, message: str, to_retu
     return to_return
 
 
-def _stop(update: Update, context: CallbackContext) -> int:
+async def _stop(update: Update, context: CallbackContext) -> int:
     """End conversation on command.
 
     :param update: The update instance that issued the /stop command.
@@ -1458,11 +1657,11 @@ def _stop(update: Update, context: CallbackContext) -> int:
     :return: The ConversationHandler.END state to stop the bot.
     """
 
-    return _stop_helper(update, context, "🎉 Thank you for using AutoGFormBot! 🎉\n"
-                                         "👋 Hope to see you again soon! 👋", ConversationHandler.END)
+    return await _stop_helper(update, context, "🎉 Thank you for using AutoGFormBot! 🎉\n"
+                                               "👋 Hope to see you again soon! 👋", ConversationHandler.END)
 
 
-def _stop_nested(update: Update, context: CallbackContext) -> str:
+async def _stop_nested(update: Update, context: CallbackContext) -> str:
     """Completely end conversation from within nested conversation.
 
     :param update: The update instance that issued the /stop command.
@@ -1470,29 +1669,27 @@ def _stop_nested(update: Update, context: CallbackContext) -> str:
     :return: The _STOPPING state to stop the bot.
     """
 
-    return _stop_helper(update, context, "😔 Aww, I'm sorry you had to stop me. 😔\n"
-                                         "🎉 Thank you for using AutoGFormBot! 🎉\n"
-                                         "👋 Hope to see you again soon! 👋", _STOPPING)
+    return await _stop_helper(update, context, "😔 Aww, I'm sorry you had to stop me. 😔\n"
+                                               "🎉 Thank you for using AutoGFormBot! 🎉\n"
+                                               "👋 Hope to see you again soon! 👋", _STOPPING)
 
 
-@_handle_background
-def _reset(update: Update, _: CallbackContext) -> str:
+async def _reset(update: Update, _: CallbackContext) -> str:
     """Handles bot reset.
 
     :param update: The update instance to reset.
     :return: The _CONFIRM_RESET state to handle reset confirmation.
     """
 
-    update.callback_query.answer()
-    update.callback_query.edit_message_text(utils.text_to_markdownv2("⚠️ IRREVERSIBLE ACTION WARNING ⚠️\n"
-                                                                     "Are you sure you want to reset?"),
-                                            parse_mode=ParseMode.MARKDOWN_V2,
-                                            reply_markup=TFMarkup.get_markup())
+    await update.callback_query.answer()
+    await update.callback_query.edit_message_text(utils.text_to_markdownv2("⚠️ IRREVERSIBLE ACTION WARNING ⚠️\n"
+                                                                           "Are you sure you want to reset?"),
+                                                  parse_mode=ParseMode.MARKDOWN_V2,
+                                                  reply_markup=_tf_markup())
     return _CONFIRM_RESET
 
 
-@_handle_background
-def _confirm_reset(update: Update, context: CallbackContext) -> Union[int, str]:
+async def _confirm_reset(update: Update, context: CallbackContext) -> Union[int, str]:
     """Handles bot reset confirmation.
 
     :param update: The update instance to confirm reset.
@@ -1503,31 +1700,29 @@ def _confirm_reset(update: Update, context: CallbackContext) -> Union[int, str]:
     # region Initialisation
 
     # Sanity check
-    try:
-        assert update.callback_query.data
-    except AssertionError:
-        _logger.error("AssertionError in _confirm_reset, please debug")
-        if update.message:
-            utils.send_bug_message(update.message)
+    if not (update.callback_query and update.callback_query.data):
+        _logger.error("_confirm_reset sanity check failed while trying to initialise")
+        await utils.send_bug_message_auto(update)
+        return _STOPPING
     data = update.callback_query.data
     to_reset = TFMarkup.confirm(data)
-    update.callback_query.answer()
+    await update.callback_query.answer()
 
     # endregion Initialisation
 
     # Reset confirmed
     if to_reset is True:
-        update.callback_query.edit_message_text(
+        await update.callback_query.edit_message_text(
             utils.text_to_markdownv2("🔁 Resetting the bot now... 🔁"),
             parse_mode=ParseMode.MARKDOWN_V2
         )
         _clear_cache(context)
-        return _start(update, context)
+        return await _start(update, context)
 
     # Cancelling reset, go back to main menu
     elif to_reset is False:
         # Removing of inline keyboard to be done in _main_menu
-        return _main_menu(update, context)
+        return await _main_menu(update, context)
 
     # An error occurred
     else:
@@ -1539,7 +1734,7 @@ def _confirm_reset(update: Update, context: CallbackContext) -> Union[int, str]:
 # region Handling unrecognised input
 
 
-def _echo(update: Update, context: CallbackContext) -> None:
+async def _echo(update: Update, context: CallbackContext) -> None:
     """Handles unrecognised non-command inputs.
 
     For the fun of it, the bot takes the non-command input and sends a modified message based on the input.
@@ -1550,39 +1745,38 @@ def _echo(update: Update, context: CallbackContext) -> None:
     """
 
     # Count how many times this has occurred
-    if _GARBAGE_INPUT_COUNTER not in context.user_data.keys():
-        context.user_data[_GARBAGE_INPUT_COUNTER] = 0
-    context.user_data[_GARBAGE_INPUT_COUNTER] = context.user_data.get(_GARBAGE_INPUT_COUNTER) + 1
+    count = context.user_data.get(_GARBAGE_INPUT_COUNTER, 0) + 1
+    context.user_data[_GARBAGE_INPUT_COUNTER] = count
 
     # If unintentional, gently prompt user to input somthing recognised
-    if context.user_data.get(_GARBAGE_INPUT_COUNTER) <= 2:
-        utils.send_potential_feature_message(
+    if count <= 2:
+        await utils.send_potential_feature_message(
             update.message,
-            "😰 Sorry, I'm not programmed to understand what {} means. 😰".format(update.message.text)
+            f"😰 Sorry, I'm not programmed to understand what {update.message.text} means. 😰"
         )
         return
 
     # Periodically, send anti-garbage prompt
-    elif context.user_data.get(_GARBAGE_INPUT_COUNTER) % _ANTI_GARBAGE_PROMPT_AFTER == 0:
-        text = _anti_garbage_replies[random.randint(0, len(_anti_garbage_replies)-1)]
+    elif count % _ANTI_GARBAGE_PROMPT_AFTER == 0:
+        text = _garbage_rng.choice(_anti_garbage_replies)
 
     # Otherwise, just fool around
     else:
-        text = _garbage_replies[random.randint(0, len(_garbage_replies)-1)]
-        if text.count("{}") == 1:
+        text, slots = _garbage_rng.choices(_garbage_replies, cum_weights=_garbage_cum_weights)[0]
+        if slots == 1:
             text = text.format(update.message.text)
-        elif text.count("{}") == 2:
+        elif slots == 2:
             text = text.format(update.message.text, update.message.from_user.full_name)
 
     # Send reply
-    update.message.reply_text(
+    await update.message.reply_text(
         utils.text_to_markdownv2(text),
         parse_mode=ParseMode.MARKDOWN_V2,
         reply_markup=ReplyKeyboardRemove()
     )
 
 
-def _unknown(update: Update, _: CallbackContext) -> None:
+async def _unknown(update: Update, _: CallbackContext) -> None:
     """Handles unrecognised command inputs.
 
     :param update: The update instance sending the command inputs.
@@ -1590,13 +1784,43 @@ def _unknown(update: Update, _: CallbackContext) -> None:
     """
 
     _logger.info("User %s issued an unknown command %s.", update.message.from_user.first_name, update.message.text)
-    utils.send_potential_feature_message(
+    await utils.send_potential_feature_message(
         update.message,
-        "😰 Sorry, I'm not programmed to understand what the {} command means. 😰".format(update.message.text)
+        f"😰 Sorry, I'm not programmed to understand what the {update.message.text} command means. 😰"
     )
 
 
-def _error_handler(update: Update, context: CallbackContext) -> None:
+@lru_cache(maxsize=1)
+def _developer_chat_id() -> Optional[str]:
+    """Helper function to read the developer chat ID from the config only once.
+
+    :return: The developer chat ID, if it is set.
+    """
+
+    return get_developer_chat_id()
+
+
+async def _send_developer_notice(bot: Bot, dev_id: str, chunks: List[str]) -> None:
+    """Helper function to send the developer notice to the developer chat.
+
+    The chunks are sent one after another so that the notice arrives in order.
+
+    :param bot: The bot instance used to send the notice.
+    :param dev_id: The developer chat ID.
+    :param chunks: The MarkdownV2-friendly chunks of the notice, each within the Telegram message length limit.
+    """
+
+    for chunk in chunks:
+        await bot.send_message(
+            chat_id=dev_id,
+            text=chunk,
+            parse_mode=ParseMode.MARKDOWN_V2,
+            disable_web_page_preview=True,
+            reply_markup=ReplyKeyboardRemove()
+        )
+
+
+async def _error_handler(update: Update, context: CallbackContext) -> None:
     """Logs errors encountered by the bot and notifies the developer via Telegram message.
 
     This script was modified from the Examples repository of the Python Telegram Bot API:
@@ -1608,35 +1832,43 @@ def _error_handler(update: Update, context: CallbackContext) -> None:
 
     _logger.error("Exception while handling an update:", exc_info=context.error)
 
-    dev_id = get_developer_chat_id()
+    dev_id = _developer_chat_id()
     if not dev_id:
         _logger.error("Developer chat ID not set!")
         return
 
     # Format traceback and log to developer chat
-    tb_list = traceback.format_exception(None, context.error, context.error.__traceback__)
-    tb_string = "".join(tb_list)
-    update_str = update.to_dict() if isinstance(update, Update) else str(update)
+    tb_buffer = StringIO()
+    traceback.print_exception(None, context.error, context.error.__traceback__, file=tb_buffer)
+    tb_string = tb_buffer.getvalue()
+    update_str = (update.to_json() if isinstance(update, Update) else str(update))[:2048]
     message = "----------------\n" \
                "DEVELOPER NOTICE\n" \
                "----------------\n" \
                "Exception raise while handling an update:\n\n" \
-               "update = {}\n\n" \
-               "context.chat_data = {}\n\n" \
-               "context.user_data = {}\n\n" \
-               "{}".format(update_str, str(context.chat_data), str(context.user_data), tb_string)
-    for i in range(0, len(message), 4096):
-        context.bot.send_message(
-            chat_id=dev_id,
-            text=utils.text_to_markdownv2(message[i:i + min(4096, len(message) - i)]),
-            parse_mode=ParseMode.MARKDOWN_V2,
-            disable_web_page_preview=True,
-            reply_markup=ReplyKeyboardRemove()
-        )
-
-    # Send generic bug message to user
-    if update.message or update.callback_query.message:
-        utils.send_bug_message(update.message if update.message else update.callback_query.message)
+               f"update = {update_str}\n\n" \
+               f"context.chat_data = {context.chat_data}\n\n" \
+               f"context.user_data = {context.user_data}\n\n" \
+               f"{tb_string}"
+    text = utils.text_to_markdownv2(message)
+    chunks = []
+    start = 0
+    while start < len(text):
+        end = start + 4096
+        if end < len(text) and text[end - 1] == "\\":
+            end -= 1  # Don't split an escape sequence across messages
+        chunks.append(text[start:end])
+        start = end
+
+    # Notify the developer and send generic bug message to user concurrently
+    results = await asyncio.gather(
+        _send_developer_notice(context.bot, dev_id, chunks),
+        utils.send_bug_message_auto(update),
+        return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            _logger.error("_error_handler failed to send error notification", exc_info=result)
 
 # endregion Handling unrecognised input
 
@@ -1652,8 +1884,17 @@ def main() -> None:
     if not token:
         _logger.error("Telegram token not set!")
         return
-    updater = Updater(token)
-    dp = updater.dispatcher
+    builder = Application.builder().token(token).concurrent_updates(True) \
+        .request(HTTPXRequest(connection_pool_size=256)) \
+        .get_updates_request(HTTPXRequest(connection_pool_size=128, http_version="1.1", pool_timeout=5.0)) \
+        .update_queue(asyncio.Queue(maxsize=10000))  # Bounded, so bursts apply backpressure instead of piling up
+
+    # Talk to a self-hosted Bot API server (e.g. http://127.0.0.1:8081) instead of api.telegram.org if one is set
+    bot_api_url = os.environ.get("TELEGRAM_BOT_API_URL")
+    if bot_api_url:
+        bot_api_url = bot_api_url.rstrip("/")
+        builder = builder.base_url(bot_api_url + "/bot").base_file_url(bot_api_url + "/file/bot").local_mode(True)
+    application = builder.build()
 
     # region Set up second level ConversationHandler (submitting form)
 
@@ -1666,14 +1907,15 @@ def main() -> None:
             confirm_handler
         ],
         states={
-            _OBTAIN_QUESTION: [CallbackQueryHandler(_obtain_question, pattern=TFMarkup.get_pattern())],
+            _OBTAIN_QUESTION: [CallbackQueryHandler(_obtain_question, pattern=_TF_PATTERN)],
             _SKIP_OR_ANSWER: [
-                MessageHandler((Filters.text & ~Filters.command) | Filters.regex("^/skip$"), _process_answer),
+                MessageHandler((filters.TEXT & ~filters.COMMAND) | filters.Regex("^" + _SLASH_SKIP + "$"),
+                               _process_answer),
                 answer_handler
             ],
-            _ANSWER_OTHER: [MessageHandler(Filters.text & ~Filters.command, _process_other)],
-            _CONFIRM_SUBMIT: [CallbackQueryHandler(_submit_answer, pattern=TFMarkup.get_pattern())],
-            _SAVE_ANSWER: [CallbackQueryHandler(_save_answer, pattern=TFMarkup.get_pattern())]
+            _ANSWER_OTHER: [MessageHandler(filters.TEXT & ~filters.COMMAND, _process_other)],
+            _CONFIRM_SUBMIT: [CallbackQueryHandler(_submit_answer, pattern=_TF_PATTERN)],
+            _SAVE_ANSWER: [CallbackQueryHandler(_save_answer, pattern=_TF_PATTERN)]
         },
         fallbacks=[CommandHandler("stop", _stop_nested)],
         map_to_parent={
@@ -1697,16 +1939,13 @@ def main() -> None:
             ],
             _CHOOSE_FREQ: [
                 CallbackQueryHandler(_custom_frequency, pattern="^" + FreqMarkup.get_custom() + "$"),
-                CallbackQueryHandler(_fixed_frequency, pattern="^(" + "|".join((FreqMarkup.get_hourly(),
-                                                                                FreqMarkup.get_daily(),
-                                                                                FreqMarkup.get_weekly(),
-                                                                                FreqMarkup.get_monthly())) + ")$")
+                CallbackQueryHandler(_fixed_frequency, pattern=_FIXED_FREQ_PATTERN)
             ],
             _CUSTOM_FREQ: [CallbackQueryHandler(_handle_custom, pattern=FreqCustomMarkup.get_pattern())],
             _SELECT_START: [CallbackQueryHandler(_start_date, pattern=DatetimeMarkup.get_pattern())],
-            _CONFIRM_ADD: [CallbackQueryHandler(_confirm_add, pattern=TFMarkup.get_pattern())],
+            _CONFIRM_ADD: [CallbackQueryHandler(_confirm_add, pattern=_TF_PATTERN)],
             _SELECT_JOB: [remind_handler],
-            _CONFIRM_REMOVE: [CallbackQueryHandler(_perform_removal, pattern=TFMarkup.get_pattern())],
+            _CONFIRM_REMOVE: [CallbackQueryHandler(_perform_removal, pattern=_TF_PATTERN)],
             _CANCEL: [CallbackQueryHandler(_remind_menu, pattern="^" + _SET_REMINDER + "$")]
         },
         fallbacks=[CommandHandler("stop", _stop_nested)],
@@ -1761,16 +2000,38 @@ def main() -> None:
         ],
         states={
             _OBTAINING_LINK: [
-                MessageHandler(Filters.entity(MessageEntity.TEXT_LINK) | Filters.entity(MessageEntity.URL), _main_menu)
+                MessageHandler(filters.Entity(MessageEntity.TEXT_LINK) | filters.Entity(MessageEntity.URL), _main_menu)
             ],
             _SELECTING_ACTION: selection_handlers,
-            _CONFIRM_RESET: [CallbackQueryHandler(_confirm_reset, pattern=TFMarkup.get_pattern())],
+            _CONFIRM_RESET: [CallbackQueryHandler(_confirm_reset, pattern=_TF_PATTERN)],
             _STOPPING: [CommandHandler("start", _start)]  # If nested /stop issued, user has to /start again
         },
         fallbacks=[CommandHandler("stop", _stop)],
         allow_reentry=True
     )
-    dp.add_handler(conv_handler)
+    application.add_handler(conv_handler)
 
     # endregion Put together main menu
 
+    # region Handle unrecognised input and errors
+
+    application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, _echo, block=False))
+    application.add_handler(MessageHandler(filters.COMMAND, _unknown, block=False))
+    application.add_error_handler(_error_handler, block=False)
+
+    # endregion Handle unrecognised input and errors
+
+    # Start the bot; long polling in development, otherwise let Telegram push updates to the webhook
+    if is_dev():
+        application.run_polling()
+    else:
+        application.run_webhook(
+            listen="0.0.0.0",
+            port=get_port(),
+            url_path=token,
+            webhook_url=get_app_url().rstrip("/") + "/" + token,
+            # Telegram echoes the secret in every request, so updates not sent by Telegram are rejected
+            secret_token=os.environ.get("TELEGRAM_WEBHOOK_SECRET") or secrets.token_urlsafe(32),
+            max_connections=100
+        )
+
@@ -7,8 +7,10 @@ This script provides a list of utilities used by various other functions.
 
 import logging
 import random
-from telegram import Message, ParseMode, ReplyKeyboardRemove
-from typing import Optional, Tuple, Union
+from telegram import Message, ReplyKeyboardRemove, Update
+from telegram.constants import ParseMode
+from telegram.error import BadRequest
+from typing import Any, Optional, Tuple, Union
 
 
 # Set up logging
@@ -61,7 +63,7 @@ def generate_random_signatures(n: int, length: Optional[int] = 5) -> Union[str,
     return result
 
 
-def send_bug_message(message: Message, bug: Optional[str] = "") -> None:
+async def send_bug_message(message: Message, bug: Optional[str] = "") -> None:
     """Helper function to send a message when a bug is caught.
 
     The function sends a message to notify the user about a bug that occurred.
@@ -81,7 +83,7 @@ def send_bug_message(message: Message, bug: Optional[str] = "") -> None:
         text = bug + "\n\n" + text
 
     # Send message
-    message.reply_text(
+    await message.reply_text(
         text_to_markdownv2(text),
         parse_mode=ParseMode.MARKDOWN_V2,
         disable_web_page_preview=True,
@@ -89,7 +91,30 @@ def send_bug_message(message: Message, bug: Optional[str] = "") -> None:
     )
 
 
-def send_potential_feature_message(message: Message, feature: Optional[str] = ""):
+async def send_bug_message_auto(update: Any, bug: Optional[str] = "") -> None:
+    """Helper function to send a bug message through whichever message instance the update carries.
+
+    The message of the update is used if present, otherwise the message of its callback query.
+    Nothing is sent if the update is not an Update instance or carries no message.
+    The callback query, if any, is answered first so the client stops showing its loading indicator.
+
+    :param update: The update instance (or any object, e.g. from an error handler) that encountered the bug.
+    :param bug: The text representing the bug that occurred.
+    """
+
+    if not isinstance(update, Update):
+        return
+    if update.callback_query:
+        try:
+            await update.callback_query.answer()
+        except BadRequest:
+            _logger.info("send_bug_message_auto callback query already answered or expired, no need to answer")
+    message = update.message or (update.callback_query.message if update.callback_query else None)
+    if message:
+        await send_bug_message(message, bug)
+
+
+async def send_potential_feature_message(message: Message, feature: Optional[str] = ""):
     """Helper function to send a message for potential unimplemented features.
 
     If the user performs some action that is not a bug but is not implemented,
@@ -108,7 +133,7 @@ def send_potential_feature_message(message: Message, feature: Optional[str] = ""
         text = feature + "\n\n" + text
 
     # Send message
-    message.reply_text(
+    await message.reply_text(
         text_to_markdownv2(text),
         parse_mode=ParseMode.MARKDOWN_V2,
         disable_web_page_preview=True,
@@ -105,6 +105,11 @@ class AbstractOptionQuestion(ABC):
         """Gets the web element for the other option input field."""
         pass
 
+    @abstractmethod
+    def is_other_option_defined(self) -> bool:
+        """Checks if the options include the 'Other' option."""
+        pass
+
     # endregion Getter methods
 
     # region Setter methods
@@ -289,6 +289,7 @@ class BaseOptionQuestion(AbstractOptionQuestion, BaseQuestion):
         _BROWSER                The selenium browser instance used to host the Google Form.
         _OPTIONS                The options defined by the Google Form question.
         _OTHER_OPTION_ELEMENT   The input field for the 'Other' option, if an 'Other' option is defined.
+        _OTHER_OPTION_DEFINED   Flag to indicate if the options include the 'Other' option.
     """
 
     # Define constants
@@ -306,6 +307,7 @@ class BaseOptionQuestion(AbstractOptionQuestion, BaseQuestion):
         BaseQuestion.__init__(self, question_element, browser)
         self._OPTIONS = None
         self._OTHER_OPTION_ELEMENT = None
+        self._OTHER_OPTION_DEFINED = False
 
     def __repr__(self) -> str:
         """Overriden __repr__ of BaseOptionQuestion class.
@@ -370,6 +372,16 @@ class BaseOptionQuestion(AbstractOptionQuestion, BaseQuestion):
                             self.__class__.__name__)
         return self._OTHER_OPTION_ELEMENT
 
+    def is_other_option_defined(self) -> bool:
+        """Checks if the options include the 'Other' option.
+
+        The flag is recorded when the options are set, so it is cheap to check on every answer.
+
+        :return: Flag to indicate if the 'Other' option is included in the options.
+        """
+
+        return self._OTHER_OPTION_DEFINED
+
     # endregion Getter methods
 
     # region Setter methods
@@ -387,6 +399,7 @@ class BaseOptionQuestion(AbstractOptionQuestion, BaseQuestion):
             return
 
         self._OPTIONS = options + (self._OTHER_OPTION_LABEL,) * has_other_option
+        self._OTHER_OPTION_DEFINED = has_other_option
 
     def set_other_option_element(self, element: WebElement) -> None:
         """Sets the other option element if it has changed.
@@ -434,6 +447,7 @@ class BaseOptionGridQuestion(BaseOptionQuestion):
         _BROWSER                The selenium browser instance used to host the Google Form.
         _OPTIONS                The options defined by the Google Form question.
         _OTHER_OPTION_ELEMENT   The input field for the 'Other' option, if an 'Other' option is defined.
+        _OTHER_OPTION_DEFINED   Flag to indicate if the options include the 'Other' option.
         _OTHER_OPTION_LABEL     The text to replace the blank aria label for any specified 'Other' options.
     """
 
@@ -469,6 +483,7 @@ class BaseOptionGridQuestion(BaseOptionQuestion):
             _logger.error("%s trying to set grid options which are not properly formatted, options=%s",
                           self.__class__.__name__, formatted_options)
             self._OPTIONS = None
+            self._OTHER_OPTION_DEFINED = False
             return
 
         # Obtain either options or sub-questions from the formatted aria label
@@ -41,6 +41,7 @@ class DropdownQuestion(BaseOptionQuestion):
         _BROWSER                The selenium browser instance used to host the Google Form.
         _OPTIONS                The options defined by the Google Form question.
         _OTHER_OPTION_ELEMENT   The input field for the 'Other' option, if an 'Other' option is defined.
+        _OTHER_OPTION_DEFINED   Flag to indicate if the options include the 'Other' option.
     """
     # Define constants
     _DROPDOWN_CSS_SELECTOR = get_dropdown_selector()  # Drop-down Options
@@ -13,6 +13,7 @@ from browser import Browser
 import logging
 from questions import BaseQuestion
 from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.remote.webelement import WebElement
 from typing import Optional, Tuple
 
@@ -41,6 +42,9 @@ class DurationQuestion(BaseQuestion):
     _DURATION_HOUR_ARIA_LABEL = "Hours"
     _DURATION_MINUTE_ARIA_LABEL = "Minutes"
     _DURATION_SECOND_ARIA_LABEL = "Seconds"
+    _DURATION_INPUT_XPATH = ".//input[@aria-label='{}' or @aria-label='{}' or @aria-label='{}']".format(
+        _DURATION_HOUR_ARIA_LABEL, _DURATION_MINUTE_ARIA_LABEL, _DURATION_SECOND_ARIA_LABEL
+    )
 
     # region Getters and Setters
 
@@ -109,17 +113,13 @@ class DurationQuestion(BaseQuestion):
             # Cascade the unwanted result
             return result
 
-        self.set_answer_elements(
-            # Obtain the hour element
-            self._QUESTION_ELEMENT.find_element(By.XPATH,
-                ".//input[@aria-label='{}']".format(self._DURATION_HOUR_ARIA_LABEL)),
-            # Obtain the minute element
-            self._QUESTION_ELEMENT.find_element(By.XPATH,
-                ".//input[@aria-label='{}']".format(self._DURATION_MINUTE_ARIA_LABEL)),
-            # Obtain the second element
-            self._QUESTION_ELEMENT.find_element(By.XPATH,
-                ".//input[@aria-label='{}']".format(self._DURATION_SECOND_ARIA_LABEL))
-        )
+        # Obtain the hour, minute and second elements in a single lookup; they are returned in document order
+        elements = self._QUESTION_ELEMENT.find_elements(By.XPATH, self._DURATION_INPUT_XPATH)
+        # Sanity check
+        if len(elements) != 3:
+            _logger.error("%s found %d duration input fields instead of 3", self.__class__.__name__, len(elements))
+            return
+        self.set_answer_elements(*elements)
         return True
 
     def answer(self, duration: str) -> Optional[bool]:
@@ -149,12 +149,11 @@ class DurationQuestion(BaseQuestion):
         except ValueError:
             _logger.error("%s trying to answer a duration with duration=%s", self.__class__.__name__, duration)
             return False
-        assert bool(isinstance(val, int) for val in (hour, minute, second))
 
-        # Send instructions to Google Forms
-        for element, answer in zip(self._ANSWER_ELEMENTS, (hour, minute, second)):
-            element.click()
-            element.send_keys(answer)
+        # Send instructions to Google Forms; tabbing moves focus from the hour to the minute and second fields
+        hour_element = self._ANSWER_ELEMENTS[0]
+        hour_element.click()
+        hour_element.send_keys(str(hour), Keys.TAB, str(minute), Keys.TAB, str(second))
         return True
 
 
@@ -42,6 +42,7 @@ class RadioQuestion(BaseOptionQuestion):
         _BROWSER                The selenium browser instance used to host the Google Form.
         _OPTIONS                The options defined by the Google Form question.
         _OTHER_OPTION_ELEMENT   The input field for the 'Other' option, if an 'Other' option is defined.
+        _OTHER_OPTION_DEFINED   Flag to indicate if the options include the 'Other' option.
         _OTHER_OPTION_LABEL     The text to replace the blank aria label for any specified 'Other' options.
     """
 
@@ -224,6 +225,7 @@ class RadioGridQuestion(BaseOptionGridQuestion, RadioQuestion):
         _BROWSER                The selenium browser instance used to host the Google Form.
         _OPTIONS                The options defined by the Google Form question.
         _OTHER_OPTION_ELEMENT   The input field for the 'Other' option, if an 'Other' option is defined.
+        _OTHER_OPTION_DEFINED   Flag to indicate if the options include the 'Other' option.
         _OTHER_OPTION_LABEL     The text to replace the blank aria label for any specified 'Other' options.
         _SUB_QUESTIONS          The sub-questions defined in the grid.
     """